@@ -1,12 +1,30 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from typing import Callable
+import functools
+import operator
+import re
+import threading
 from datetime import datetime, timedelta, date
 import numpy as np
 import pandas as pd
-import random
 import string
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # optional: display formatting falls back to pandas
+    pa = None
+    pc = None
+
+try:
+    from numba import njit
+except ImportError:  # optional: numeric range filters fall back to NumPy
+    njit = None
+
 # -----------------------------
 # Utilities: logging to Text
 # -----------------------------
@@ -27,7 +45,7 @@ class TextLogger:
 # -----------------------------
 # Data layer
 # -----------------------------
-@dataclass
+@dataclass(frozen=True)
 class FilterSpec:
     column: str
     op: str
@@ -35,186 +53,523 @@ class FilterSpec:
     value2: str = ""  # used for "between"
 
 
+# comparison ops shared by the numeric and datetime paths ("between" is handled apart)
+_NUMERIC_OPS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+# frames at least this long use the fused range kernel (below it the JIT warmup isn't worth it)
+NUMBA_MIN_ROWS = 50_000
+
+if njit is not None:
+    @njit(cache=True)
+    def _range_mask(arr, lo, hi, lo_strict, hi_strict):
+        """One pass lo <(=) x <(=) hi over a float64 array; NaN never matches."""
+        out = np.empty(arr.size, np.bool_)
+        for i in range(arr.size):
+            x = arr[i]
+            ok_lo = x > lo if lo_strict else x >= lo
+            ok_hi = x < hi if hi_strict else x <= hi
+            out[i] = ok_lo and ok_hi
+        return out
+else:
+    _range_mask = None
+
+# ops whose masks go through the text-mask LRU in DataModel
+_TEXT_OPS = ("=", "!=", "contains", "startswith", "endswith")
+
+# op -> (lo/hi bound taken from the value, strict) for the fused range kernel
+_RANGE_OPS = {
+    "<": ("hi", True),
+    "<=": ("hi", False),
+    ">": ("lo", True),
+    ">=": ("lo", False),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _no_rows(n: int) -> np.ndarray:
+    """Shared read-only all-False mask of length n (can't-compare results)."""
+    mask = np.zeros(n, dtype=bool)
+    mask.flags.writeable = False
+    return mask
+
+
+@functools.lru_cache(maxsize=8)
+def _all_rows(n: int) -> np.ndarray:
+    """Shared read-only all-True mask of length n (no-op filters)."""
+    mask = np.ones(n, dtype=bool)
+    mask.flags.writeable = False
+    return mask
+
+
+def _as_mask(x) -> np.ndarray:
+    """Boolean Series/array -> plain numpy bool array (NA counts as False)."""
+    if isinstance(x, pd.Series):
+        return x.to_numpy(dtype=bool, na_value=False)
+    return np.asarray(x, dtype=bool)
+
+
 class DataModel:
     """
     Holds the raw dataframe and the filtered view.
     Filtering is designed to be general: it tries numeric, datetime, and fallback to string.
+
+    Each filter is evaluated to a boolean mask over the full df. Masks are cached per
+    FilterSpec, so adding/removing a filter only evaluates the new one; the view is a
+    single AND of cached masks.
+
+    `view` may be `df` itself (no filters / nothing filtered out); treat it as read-only.
+
+    On large frames add/clear/remove filter compute the view on a worker thread; the UI
+    calls poll() until it returns True before reading `view`.
     """
+    TEXT_MASK_CACHE_SIZE = 64
+    BACKGROUND_MIN_ROWS = 100_000  # filter edits on frames this large run off the Tk thread
+
     def __init__(self, logger: TextLogger | None = None):
         self.df: pd.DataFrame | None = None
         self.view: pd.DataFrame | None = None
+        self.view_rows: np.ndarray | None = None  # positions of view rows in df (None = all)
         self.filters: list[FilterSpec] = []
         self.logger = logger
+        self._mask_cache: dict[FilterSpec, np.ndarray] = {}
+        # coercions of df columns / parsed filter values, reused across filter edits
+        self._numeric_cache: dict[str, pd.Series] = {}
+        self._datetime_cache: dict[str, pd.Series] = {}
+        self._value_cache: dict[str, tuple] = {}
+        self._regex_cache: dict[tuple[str, str], re.Pattern] = {}
+        self._handlers: dict[str, Callable[[str, str, str], np.ndarray]] = {}
+        self._filters_sig: tuple[FilterSpec, ...] | None = None  # filters behind the current view
+        self._text_mask_cache: OrderedDict[tuple[str, str, str], np.ndarray] = OrderedDict()
+        # background filtering: one worker, so runs never overlap
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="filters")
+        self._pending: Future | None = None
+        self._deferred_logs: deque[str] = deque()
 
     def set_df(self, df: pd.DataFrame):
+        self._drain()
         self.df = df
         self.filters = []
+        self._mask_cache = {}
+        self._numeric_cache = {}
+        self._datetime_cache = {}
+        self._text_mask_cache.clear()
+        self._filters_sig = None
+        self._build_column_handlers()
         self.apply_filters()
 
     def apply_filters(self):
+        self._drain()
+        self._apply_filters(tuple(self.filters))
+
+    def poll(self) -> bool:
+        """
+        UI thread: True once no background filter run is pending (view is current).
+        Also flushes log lines from the worker, since the logger writes to Tk.
+        """
+        if self._pending is not None and not self._pending.done():
+            return False
+        self._pending = None
+        while self._deferred_logs:
+            msg = self._deferred_logs.popleft()
+            if self.logger:
+                self.logger.log(msg)
+        return True
+
+    def _refilter(self):
+        if self.df is None or len(self.df) < self.BACKGROUND_MIN_ROWS:
+            self.apply_filters()
+            return
+        if self._pending is not None:
+            self._pending.cancel()  # drops it only if it hasn't started; a running one is superseded
+        self._pending = self._executor.submit(self._apply_filters, tuple(self.filters))
+
+    def _drain(self):
+        """Waits for a background run, so the caches aren't touched from two threads."""
+        if self._pending is not None:
+            self._pending.cancel()
+            wait([self._pending])
+
+    def _log(self, msg: str):
+        if threading.current_thread() is threading.main_thread():
+            if self.logger:
+                self.logger.log(msg)
+        else:
+            self._deferred_logs.append(msg)
+
+    def _apply_filters(self, filters: tuple[FilterSpec, ...]):
         if self.df is None:
             self.view = None
+            self.view_rows = None
+            self._filters_sig = None
+            return
+
+        # same filter list as the current view (FilterSpec is frozen/hashable): nothing to do
+        if filters == self._filters_sig:
             return
+        self._filters_sig = filters
 
-        df = self.df.copy()
-        for f in self.filters:
+        self.view_rows = None
+        df = self.df
+        combined = None
+        for f in filters:
             if f.column not in df.columns:
                 continue
-            try:
-                df = self._apply_single_filter(df, f)
-            except Exception as e:
-                if self.logger:
-                    self.logger.log(f"Filter failed on {f.column} {f.op}: {e}")
-        self.view = df
+            mask = self._mask_cache.get(f)
+            if mask is None:
+                try:
+                    mask = self._compute_mask(df, f)
+                except Exception as e:
+                    self._log(f"Filter failed on {f.column} {f.op}: {e}")
+                    continue
+                self._mask_cache[f] = mask
+            if mask is _all_rows(len(df)):
+                continue
+            combined = mask if combined is None else combined & mask
+            if mask is _no_rows(len(df)) or not combined.any():
+                # no row can survive; remaining filters are evaluated when they matter
+                break
+
+        if combined is None:
+            # nothing to filter: the view is the frame itself, no row gather
+            self.view = df
+            return
+        if combined.all():
+            self.view = df
+            return
+        self.view_rows = np.flatnonzero(combined)
+        self.view = df.iloc[self.view_rows]
 
     def add_filter(self, spec: FilterSpec):
         self.filters.append(spec)
-        self.apply_filters()
+        self._refilter()
 
     def clear_filters(self):
         self.filters = []
-        self.apply_filters()
+        self._refilter()
 
     def remove_filter_at(self, idx: int):
         if 0 <= idx < len(self.filters):
-            self.filters.pop(idx)
-            self.apply_filters()
+            spec = self.filters.pop(idx)
+            if spec not in self.filters:
+                self._mask_cache.pop(spec, None)
+            self._refilter()
+
+    def _numeric_series(self, column: str) -> pd.Series:
+        s_num = self._numeric_cache.get(column)
+        if s_num is None:
+            s_num = pd.to_numeric(self.df[column], errors="coerce")
+            self._numeric_cache[column] = s_num
+        return s_num
+
+    def _datetime_series(self, column: str) -> pd.Series:
+        s_dt = self._datetime_cache.get(column)
+        if s_dt is None:
+            s_dt = pd.to_datetime(self.df[column], errors="coerce")
+            self._datetime_cache[column] = s_dt
+        return s_dt
+
+    def _parse_value(self, x: str) -> tuple:
+        """
+        Returns (as_float | None, as_timestamp | None) for a filter input.
+        Accepts flexible date inputs: "2026-01-07", "07.01.2026", "2026/01/07", etc.
+        """
+        parsed = self._value_cache.get(x)
+        if parsed is None:
+            try:
+                num = float(x)
+            except Exception:
+                num = None
+            try:
+                dt = pd.to_datetime(x, errors="raise")
+            except Exception:
+                dt = None
+            parsed = (num, dt)
+            self._value_cache[x] = parsed
+        return parsed
 
-    def _apply_single_filter(self, df: pd.DataFrame, f: FilterSpec) -> pd.DataFrame:
+    def _compute_mask(self, df: pd.DataFrame, f: FilterSpec) -> np.ndarray:
         s = df[f.column]
 
         op = f.op
         v1 = (f.value1 or "").strip()
         v2 = (f.value2 or "").strip()
 
-        # helpers
-        def try_to_numeric(x: str):
-            try:
-                return float(x)
-            except Exception:
-                return None
-
-        def try_to_datetime(x: str):
-            # Accept flexible inputs: "2026-01-07", "07.01.2026", "2026/01/07", etc.
-            try:
-                return pd.to_datetime(x, errors="raise")
-            except Exception:
-                return None
-
         # Null ops
         if op == "is null":
-            return df[s.isna()]
+            return s.isna().to_numpy()
         if op == "is not null":
-            return df[~s.isna()]
+            return s.notna().to_numpy()
+
+        if op not in _TEXT_OPS:
+            return self._handlers[f.column](op, v1, v2)
+
+        # text ops: LRU of recent masks, so retyping / re-adding a needle is a lookup
+        key = (f.column, op, v1.lower() if op == "contains" else v1)
+        mask = self._text_mask_cache.get(key)
+        if mask is not None:
+            self._text_mask_cache.move_to_end(key)
+            return mask
+        mask = self._handlers[f.column](op, v1, v2)
+        self._text_mask_cache[key] = mask
+        if len(self._text_mask_cache) > self.TEXT_MASK_CACHE_SIZE:
+            self._text_mask_cache.popitem(last=False)
+        return mask
+
+    # --- per-column handlers (dtype dispatch done once per df) ---
+    def _build_column_handlers(self):
+        """
+        Binds one mask function per column, chosen once from its dtype:
+        datetime / numeric / string-categorical columns get specialized handlers,
+        anything else goes through the generic datetime -> numeric -> string probing.
+        """
+        self._handlers = {}
+        for col in self.df.columns:
+            s = self.df[col]
+            if pd.api.types.is_datetime64_any_dtype(s):
+                handler = self._datetime_handler(s)
+            elif pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+                handler = self._numeric_handler(col, s)
+            elif isinstance(s.dtype, pd.CategoricalDtype) and s.cat.categories.inferred_type == "string":
+                handler = self._categorical_handler(col, s)
+            elif s.dtype == object and not s.hasnans and pd.api.types.infer_dtype(s, skipna=False) == "string":
+                handler = self._text_handler(col, s)
+            else:
+                handler = functools.partial(self._generic_mask, col)
+            self._handlers[col] = handler
+
+    def _datetime_handler(self, s: pd.Series):
+        norm = None    # midnight-normalized column, built on first =/!= filter
+        order = None   # argsort of the non-NaT values, built on first between
+        ordered = None
+
+        def handler(op: str, v1: str, v2: str) -> np.ndarray:
+            nonlocal norm, order, ordered
+            dt_v1 = self._parse_value(v1)[1]
+            dt_v2 = self._parse_value(v2)[1] if v2 else None
+            if (op == "between" and dt_v1 is not None and dt_v2 is not None
+                    and s.dt.tz is None and dt_v1.tz is None and dt_v2.tz is None):
+                # sorted copy: a date window is two binary searches instead of two full compares
+                if order is None:
+                    vals = s.to_numpy(dtype="datetime64[ns]")
+                    order = np.argsort(vals, kind="stable")
+                    order = order[~np.isnat(vals[order])]
+                    ordered = vals[order]
+                lo, hi = (dt_v1, dt_v2) if dt_v1 <= dt_v2 else (dt_v2, dt_v1)
+                i = np.searchsorted(ordered, lo.to_datetime64(), side="left")
+                j = np.searchsorted(ordered, hi.to_datetime64(), side="right")
+                mask = np.zeros(len(s), dtype=bool)
+                mask[order[i:j]] = True
+                return mask
+            if op in ("=", "!=") and norm is None:
+                norm = s.dt.normalize()
+            return self._datetime_ops(s, op, v1, dt_v1, dt_v2, norm)
+
+        return handler
+
+    def _numeric_handler(self, column: str, s: pd.Series):
+        arr = s.to_numpy(dtype=float, na_value=np.nan)
+
+        def handler(op: str, v1: str, v2: str) -> np.ndarray:
+            num_v1 = self._parse_value(v1)[0]
+            if num_v1 is None or (op not in _NUMERIC_OPS and op != "between"):
+                # text ops / non-numeric input keep the generic semantics
+                return self._generic_mask(column, op, v1, v2)
+            fused = _range_mask is not None and len(arr) >= NUMBA_MIN_ROWS
+            if op == "between":
+                num_v2 = self._parse_value(v2)[0] if v2 else None
+                if num_v2 is None:
+                    return _no_rows(len(arr))
+                lo, hi = (num_v1, num_v2) if num_v1 <= num_v2 else (num_v2, num_v1)
+                if fused:
+                    return _range_mask(arr, lo, hi, False, False)
+                return (arr >= lo) & (arr <= hi)
+            if fused and op in _RANGE_OPS:
+                side, strict = _RANGE_OPS[op]
+                if side == "lo":
+                    return _range_mask(arr, num_v1, np.inf, strict, False)
+                return _range_mask(arr, -np.inf, num_v1, False, strict)
+            return _NUMERIC_OPS[op](arr, num_v1)
+
+        return handler
+
+    def _categorical_handler(self, column: str, s: pd.Series):
+        """
+        =, != and contains on a string categorical: evaluated on the categories and
+        gathered through the integer codes. Other ops use the generic path.
+        """
+        cats = s.cat.categories
+        codes = s.cat.codes.to_numpy()
+        code_of = {c: i for i, c in enumerate(cats)}
+        # would the generic path read these categories as dates / numbers?
+        cats_as_dates = bool(pd.to_datetime(cats, errors="coerce").notna().any())
+        cats_as_numbers = bool(pd.to_numeric(cats, errors="coerce").notna().any())
+
+        def handler(op: str, v1: str, v2: str) -> np.ndarray:
+            num_v1, dt_v1 = self._parse_value(v1)
+            if (op not in ("=", "!=", "contains")
+                    or (dt_v1 is not None and cats_as_dates)
+                    or (num_v1 is not None and cats_as_numbers)):
+                return self._generic_mask(column, op, v1, v2)
+
+            if op == "contains":
+                cat_hit = np.asarray(cats.str.contains(self._pattern(op, v1), na=False), dtype=bool)
+                # code -1 (missing) picks the trailing entry, which mirrors fillna("")
+                return np.append(cat_hit, v1 == "")[codes]
+
+            hit = codes == code_of.get(v1, -2)
+            if v1 == "":
+                hit |= codes == -1
+            return hit if op == "=" else ~hit
+
+        return handler
+
+    def _text_handler(self, column: str, s: pd.Series):
+        """
+        Plain text column (isin, wkn, name, ...): text ops run on a fixed-width
+        unicode copy with np.char instead of Series.str on Python objects.
+        """
+        arr = s.to_numpy(dtype=str)
+        lowered = None  # lower-cased copy, built on first contains
+
+        def handler(op: str, v1: str, v2: str) -> np.ndarray:
+            nonlocal lowered
+            num_v1, dt_v1 = self._parse_value(v1)
+            if (op not in _TEXT_OPS
+                    or (dt_v1 is not None and self._datetime_series(column).notna().any())
+                    or (num_v1 is not None and self._numeric_series(column).notna().any())):
+                return self._generic_mask(column, op, v1, v2)
+
+            if op == "=":
+                return arr == v1
+            if op == "!=":
+                return arr != v1
+            if op == "contains":
+                if lowered is None:
+                    lowered = np.char.lower(arr)
+                return np.char.find(lowered, v1.lower()) >= 0
+            if op == "startswith":
+                return np.char.startswith(arr, v1)
+            return np.char.endswith(arr, v1)
 
-        # Try numeric compare if possible
-        num_v1 = try_to_numeric(v1)
-        num_v2 = try_to_numeric(v2) if v2 else None
+        return handler
 
-        # Try datetime compare if possible (and if series looks datetime-like or v parses)
-        dt_v1 = try_to_datetime(v1)
-        dt_v2 = try_to_datetime(v2) if v2 else None
+    def _generic_mask(self, column: str, op: str, v1: str, v2: str) -> np.ndarray:
+        s = self.df[column]
 
-        is_series_datetime = pd.api.types.is_datetime64_any_dtype(s)
+        # Try numeric / datetime compare if possible (and if series looks datetime-like or v parses)
+        num_v1, dt_v1 = self._parse_value(v1)
+        num_v2, dt_v2 = self._parse_value(v2) if v2 else (None, None)
 
         # Decide comparison mode:
-        # 1) if series is datetime OR value parses as datetime and series convertible => datetime mode
+        # 1) if value parses as datetime and series convertible => datetime mode
         # 2) else if value parses numeric and series numeric-ish => numeric mode
         # 3) else string mode
-        datetime_mode = False
-        if is_series_datetime:
-            datetime_mode = True
-        elif dt_v1 is not None:
+        if dt_v1 is not None:
             # attempt to convert series to datetime (non-destructive via temporary)
-            tmp = pd.to_datetime(s, errors="coerce")
+            tmp = self._datetime_series(column)
             if tmp.notna().any():
-                s = tmp
-                datetime_mode = True
-
-        if datetime_mode:
-            if dt_v1 is None and op not in ("contains", "startswith", "endswith"):
-                # can't compare
-                return df.iloc[0:0]
-
-            if op == "=":
-                return df[s.dt.date == dt_v1.date()]
-            if op == "!=":
-                return df[s.dt.date != dt_v1.date()]
-            if op == "<":
-                return df[s < dt_v1]
-            if op == "<=":
-                return df[s <= dt_v1]
-            if op == ">":
-                return df[s > dt_v1]
-            if op == ">=":
-                return df[s >= dt_v1]
-            if op == "between":
-                if dt_v2 is None:
-                    return df.iloc[0:0]
-                lo, hi = (dt_v1, dt_v2) if dt_v1 <= dt_v2 else (dt_v2, dt_v1)
-                return df[(s >= lo) & (s <= hi)]
-
-            # fallback to string-type ops on datetime as formatted
-            s_str = s.dt.strftime("%Y-%m-%d %H:%M:%S").fillna("")
-            return self._apply_string_ops(df, s_str, op, v1)
+                return self._datetime_ops(tmp, op, v1, dt_v1, dt_v2)
 
         # numeric mode?
         if num_v1 is not None:
-            s_num = pd.to_numeric(s, errors="coerce")
+            s_num = self._numeric_series(column)
             if s_num.notna().any():
-                if op == "=":
-                    return df[s_num == num_v1]
-                if op == "!=":
-                    return df[s_num != num_v1]
-                if op == "<":
-                    return df[s_num < num_v1]
-                if op == "<=":
-                    return df[s_num <= num_v1]
-                if op == ">":
-                    return df[s_num > num_v1]
-                if op == ">=":
-                    return df[s_num >= num_v1]
+                if op in _NUMERIC_OPS:
+                    return _as_mask(_NUMERIC_OPS[op](s_num, num_v1))
                 if op == "between":
                     if num_v2 is None:
-                        return df.iloc[0:0]
+                        return _no_rows(len(s))
                     lo, hi = (num_v1, num_v2) if num_v1 <= num_v2 else (num_v2, num_v1)
-                    return df[(s_num >= lo) & (s_num <= hi)]
+                    return _as_mask((s_num >= lo) & (s_num <= hi))
                 # string ops on numeric as text
                 s_str = s_num.map(lambda x: "" if pd.isna(x) else str(x))
-                return self._apply_string_ops(df, s_str, op, v1)
+                return self._apply_string_ops(s_str, op, v1)
 
         # string mode
         s_str = s.astype("string").fillna("")
-        return self._apply_string_ops(df, s_str, op, v1)
+        return self._apply_string_ops(s_str, op, v1)
+
+    def _datetime_ops(self, s: pd.Series, op: str, v1: str, dt_v1, dt_v2,
+                      norm: pd.Series | None = None) -> np.ndarray:
+        n = len(s)
+        if dt_v1 is None and op not in ("contains", "startswith", "endswith"):
+            # can't compare
+            return _no_rows(n)
+
+        if op in ("=", "!="):
+            # same calendar day <=> same normalized timestamp
+            if norm is None:
+                norm = s.dt.normalize()
+            day = dt_v1.normalize()
+            return _as_mask(norm == day) if op == "=" else _as_mask(norm != day)
+        if op in _NUMERIC_OPS:
+            return _as_mask(_NUMERIC_OPS[op](s, dt_v1))
+        if op == "between":
+            if dt_v2 is None:
+                return _no_rows(n)
+            lo, hi = (dt_v1, dt_v2) if dt_v1 <= dt_v2 else (dt_v2, dt_v1)
+            return _as_mask((s >= lo) & (s <= hi))
 
-    def _apply_string_ops(self, df: pd.DataFrame, s_str: pd.Series, op: str, v1: str) -> pd.DataFrame:
+        # fallback to string-type ops on datetime as formatted
+        s_str = s.dt.strftime("%Y-%m-%d %H:%M:%S").fillna("")
+        return self._apply_string_ops(s_str, op, v1)
+
+    def _pattern(self, op: str, needle: str) -> re.Pattern:
+        """
+        Compiled (and cached) regex for a text op; the needle is matched literally.
+        contains is case-insensitive, startswith/endswith are case-sensitive.
+        """
+        key = (op, needle)
+        pat = self._regex_cache.get(key)
+        if pat is None:
+            if op == "contains":
+                pat = re.compile(re.escape(needle), re.IGNORECASE)
+            elif op == "startswith":
+                pat = re.compile("^" + re.escape(needle))
+            else:
+                # \Z, not $: $ also matches before a trailing newline ("abc\n" must not endswith "abc")
+                pat = re.compile(re.escape(needle) + r"\Z")
+            self._regex_cache[key] = pat
+        return pat
+
+    def _apply_string_ops(self, s_str: pd.Series, op: str, v1: str) -> np.ndarray:
         needle = v1
         if op == "=":
-            return df[s_str == needle]
+            return _as_mask(s_str == needle)
         if op == "!=":
-            return df[s_str != needle]
-        if op == "contains":
-            return df[s_str.str.contains(needle, case=False, na=False)]
-        if op == "startswith":
-            return df[s_str.str.startswith(needle)]
-        if op == "endswith":
-            return df[s_str.str.endswith(needle)]
+            return _as_mask(s_str != needle)
+        if op in ("contains", "startswith", "endswith"):
+            return _as_mask(s_str.str.contains(self._pattern(op, needle), regex=True, na=False))
         # unsupported => no-op
-        return df
+        return _all_rows(len(s_str))
 
 
 # -----------------------------
 # Fake data generator
 # -----------------------------
-def _rand_isin():
+_ALNUM = np.frombuffer((string.ascii_uppercase + string.digits).encode(), dtype="S1")
+
+def _rand_codes(rng: np.random.Generator, n: int, k: int) -> np.ndarray:
+    # n random alnum codes of length k, built as one (n, k) byte matrix
+    idx = rng.integers(0, len(_ALNUM), size=(n, k))
+    return _ALNUM[idx].view(f"S{k}").ravel()
+
+def _rand_isins(rng: np.random.Generator, n: int) -> np.ndarray:
     # simplistic fake ISIN: 2 letters + 10 alnum
-    cc = random.choice(["DE", "FR", "ES", "NL", "IT", "US", "GB"])
-    body = "".join(random.choices(string.ascii_uppercase + string.digits, k=10))
-    return cc + body
+    cc = rng.choice(np.array(["DE", "FR", "ES", "NL", "IT", "US", "GB"], dtype="S2"), size=n)
+    return np.char.add(cc, _rand_codes(rng, n, 10)).astype(str)
 
-def _rand_wkn():
+def _rand_wkns(rng: np.random.Generator, n: int) -> np.ndarray:
     # German WKN is usually 6 chars
-    return "".join(random.choices(string.ascii_uppercase + string.digits, k=6))
+    return _rand_codes(rng, n, 6).astype(str)
 
 def make_fake_underlyings(n_rows=700, seed=42) -> pd.DataFrame:
     rng = np.random.default_rng(seed)
@@ -234,9 +589,9 @@ def make_fake_underlyings(n_rows=700, seed=42) -> pd.DataFrame:
     event_next[mask_today] = today + pd.to_timedelta(rng.integers(6, 18, size=mask_today.sum()), unit="h")
 
     df = pd.DataFrame({
-        "isin": [_rand_isin() for _ in range(n_rows)],
-        "wkn":  [_rand_wkn() for _ in range(n_rows)],
-        "name": [f"Company {i:04d}" for i in range(1, n_rows + 1)],
+        "isin": _rand_isins(rng, n_rows),
+        "wkn":  _rand_wkns(rng, n_rows),
+        "name": np.char.add("Company ", np.char.zfill(np.arange(1, n_rows + 1).astype(str), 4)),
         "sector": rng.choice(sectors, size=n_rows),
         "country": rng.choice(countries, size=n_rows),
         "currency": rng.choice(currencies, size=n_rows),
@@ -256,6 +611,10 @@ def make_fake_underlyings(n_rows=700, seed=42) -> pd.DataFrame:
         "note": rng.choice(["", "Watch", "Earnings", "Dividend", "Split"], size=n_rows, p=[0.75, 0.10, 0.08, 0.05, 0.02]),
     })
 
+    # Low-cardinality text columns as category: less memory, filters compare on codes
+    for c in ("sector", "country", "currency", "note"):
+        df[c] = df[c].astype("category")
+
     # Ensure 20 columns (we already have 20)
     return df
 
@@ -263,19 +622,28 @@ def make_fake_underlyings(n_rows=700, seed=42) -> pd.DataFrame:
 # -----------------------------
 # UI components
 # -----------------------------
+_TODAY_TAGS = ("event_today",)
+
+
 class DataTable(ttk.Frame):
     """
     A Treeview-based table that can render any DataFrame.
     Highlights rows where EventNext is today (date match).
+
+    Large frames are virtualized: only the rows in the viewport are inserted into the
+    Treeview, and the vertical scrollbar/mouse wheel move that window over the rows.
     """
+    VIRTUAL_ROW_THRESHOLD = 2000   # above this, only the visible window is materialized
+    DEFAULT_ROW_PX = 20            # fallback when the theme doesn't report a rowheight
+
     def __init__(self, parent, logger: TextLogger):
         super().__init__(parent)
         self.logger = logger
 
         self.tree = ttk.Treeview(self, columns=(), show="headings")
-        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self._on_vscroll)
         self.hsb = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=self.vsb.set, xscrollcommand=self.hsb.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=self.hsb.set)
 
         self.tree.grid(row=0, column=0, sticky="nsew")
         self.vsb.grid(row=0, column=1, sticky="ns")
@@ -287,18 +655,69 @@ class DataTable(ttk.Frame):
         # Tag for "today"
         self.tree.tag_configure("event_today", background="#fff2cc")  # soft highlight
 
-        # store current df
+        # Virtual mode state: all display rows + first visible row
+        self._rows: np.ndarray | None = None
+        self._row_px: int | None = None
+        self._today_mask: np.ndarray | None = None
+        self._first_row = 0
+
+        self.tree.bind("<Configure>", lambda _e: self._render_window())
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_wheel)
+
+        # current source df, its display strings and normalized EventNext
         self._df: pd.DataFrame | None = None
+        self._display_matrix: np.ndarray | None = None
+        self._event_days: pd.Series | None = None
 
     def set_dataframe(self, df: pd.DataFrame):
+        """Shows `df` as-is (stringified on every call)."""
+        self.set_source(df)
+        self.show_rows(None)
+
+    def set_source(self, df: pd.DataFrame):
+        """
+        Stringifies `df` once; show_rows() then displays subsets of it by position,
+        so filter changes only gather rows instead of re-formatting them.
+        """
         self._df = df
         self._rebuild_columns(df.columns.tolist())
-        self._populate_rows(df)
+        self._display_matrix = self._to_display_strings(df) if not df.empty else None
+
+        # EventNext as midnight-normalized datetime64, for the "today" highlight
+        self._event_days = None
+        if "EventNext" in df.columns:
+            ev = df["EventNext"]
+            if not pd.api.types.is_datetime64_any_dtype(ev):
+                ev = pd.to_datetime(ev, errors="coerce")
+            self._event_days = ev.dt.normalize()
+
+    def show_rows(self, positions: np.ndarray | None):
+        """Displays the source rows at `positions` (None = all rows)."""
+        self._clear_rows()
+        if self._display_matrix is None:
+            return
+
+        values = self._display_matrix if positions is None else self._display_matrix[positions]
+        if len(values) == 0:
+            return
+
+        # Highlight logic: compare midnight-normalized datetime64 values; no per-row date objects
+        if self._event_days is not None:
+            ev = self._event_days
+            today_mask = (ev == pd.Timestamp(date.today(), tz=ev.dt.tz)).to_numpy()
+            if positions is not None:
+                today_mask = today_mask[positions]
+        else:
+            today_mask = np.zeros(len(values), dtype=bool)
+
+        self._populate_rows(values, today_mask)
 
     def clear(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._clear_rows()
         self._df = None
+        self._display_matrix = None
+        self._event_days = None
 
     def _rebuild_columns(self, columns: list[str]):
         # clear old
@@ -308,39 +727,126 @@ class DataTable(ttk.Frame):
             # simple width heuristic; user can resize manually
             self.tree.column(col, width=max(90, min(220, 9 * len(col))), anchor="w")
 
-    def _populate_rows(self, df: pd.DataFrame):
-        # clear old rows
+    def _clear_rows(self):
         for item in self.tree.get_children():
             self.tree.delete(item)
-
-        if df is None or df.empty:
+        self._rows = None
+        self._today_mask = None
+        self._first_row = 0
+
+    def _populate_rows(self, values: np.ndarray, today_mask: np.ndarray):
+        if len(values) > self.VIRTUAL_ROW_THRESHOLD:
+            # keep the matrix; only the visible slice is turned into Python lists
+            self._rows = values
+            self._today_mask = today_mask
+            self._render_window()
             return
 
-        # Highlight logic: if there's EventNext column and it's datetime-like
-        today = date.today()
-        has_eventnext = "EventNext" in df.columns
-
-        # Insert rows
-        # NOTE: Treeview needs strings; keep datetimes readable
-        for _, row in df.iterrows():
-            values = []
-            tags = ()
-            for col in df.columns:
-                val = row[col]
-                if isinstance(val, (pd.Timestamp, datetime)):
-                    val = pd.to_datetime(val).strftime("%Y-%m-%d %H:%M:%S")
-                values.append("" if pd.isna(val) else str(val))
-
-            if has_eventnext:
-                try:
-                    ev = row["EventNext"]
-                    ev_dt = pd.to_datetime(ev, errors="coerce")
-                    if pd.notna(ev_dt) and ev_dt.date() == today:
-                        tags = ("event_today",)
-                except Exception:
-                    pass
+        # Tk defers layout/redraw to idle time, so these inserts are drawn once afterwards
+        insert = self.tree.insert
+        for row, is_today in zip(values.tolist(), today_mask):
+            insert("", "end", values=row, tags=_TODAY_TAGS if is_today else ())
 
-            self.tree.insert("", "end", values=values, tags=tags)
+    # --- virtual scrolling ---
+    def _visible_rows(self) -> int:
+        if self._row_px is None:
+            # theme row height, looked up once rather than on every scroll step
+            try:
+                self._row_px = int(ttk.Style(self).lookup("Treeview", "rowheight") or self.DEFAULT_ROW_PX)
+            except (tk.TclError, ValueError):
+                self._row_px = self.DEFAULT_ROW_PX
+        height = self.tree.winfo_height()
+        if height <= 1:
+            # not mapped yet; <Configure> re-renders with the real size
+            return 50
+        return max(1, height // self._row_px)
+
+    def _render_window(self):
+        if self._rows is None:
+            return
+        n = len(self._rows)
+        page = self._visible_rows()
+        self._first_row = max(0, min(self._first_row, n - page))
+        last = min(n, self._first_row + page)
+
+        self.tree.delete(*self.tree.get_children())
+        insert = self.tree.insert
+        rows = self._rows[self._first_row:last].tolist()
+        for row, is_today in zip(rows, self._today_mask[self._first_row:last]):
+            insert("", "end", values=row, tags=_TODAY_TAGS if is_today else ())
+        self.vsb.set(self._first_row / n, last / n)
+
+    def _on_vscroll(self, *args):
+        if self._rows is None:
+            self.tree.yview(*args)
+            return
+        if args[0] == "moveto":
+            self._first_row = int(float(args[1]) * len(self._rows))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self._first_row += step * self._visible_rows() if args[2] == "pages" else step
+        self._render_window()
+
+    def _on_tree_yscroll(self, first, last):
+        # in virtual mode the scrollbar tracks the window, not the tree's own items
+        if self._rows is None:
+            self.vsb.set(first, last)
+
+    def _on_wheel(self, event):
+        if self._rows is None:
+            return None
+        up = event.num == 4 or event.delta > 0
+        self._first_row += -3 if up else 3
+        self._render_window()
+        return "break"
+
+    @staticmethod
+    def _to_display_strings(df: pd.DataFrame) -> np.ndarray:
+        """
+        Returns a 2D object array of display strings (rows x cols).
+        NaN/NaT become "", datetimes are rendered as "%Y-%m-%d %H:%M:%S".
+        Missing cells are blanked in one pass from a single isna() matrix.
+        """
+        cols = []
+        for col in df.columns:
+            s = df[col]
+            if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_datetime64_any_dtype(s):
+                # keep Python's repr ("3.0", "True"), which Arrow's cast would change
+                cols.append(s.astype(str).to_numpy(dtype=object))
+                continue
+            arr = DataTable._arrow_display_strings(s) if pa is not None else None
+            if arr is None:
+                if pd.api.types.is_datetime64_any_dtype(s):
+                    s_str = s.dt.strftime("%Y-%m-%d %H:%M:%S")
+                else:
+                    s_str = s.astype("string")
+                arr = s_str.to_numpy(dtype=object)
+            cols.append(arr)
+        if not cols:
+            return np.empty((len(df), 0), dtype=object)
+        out = np.asarray(cols, dtype=object).T
+        out[df.isna().to_numpy()] = ""
+        return out
+
+    @staticmethod
+    def _arrow_display_strings(s: pd.Series) -> np.ndarray | None:
+        """
+        Datetime/text column -> object array of str using Arrow's vectorized kernels.
+        Returns None if the column can't be represented in Arrow (e.g. mixed objects).
+        """
+        try:
+            arr = pa.array(s, from_pandas=True)
+            if pa.types.is_dictionary(arr.type):
+                arr = arr.dictionary_decode()
+            if pa.types.is_timestamp(arr.type):
+                # whole seconds, otherwise %S renders the fractional part
+                arr = arr.cast(pa.timestamp("s", tz=arr.type.tz), safe=False)
+                arr = pc.strftime(arr, format="%Y-%m-%d %H:%M:%S")
+            else:
+                arr = pc.cast(arr, pa.string())
+            return pc.fill_null(arr, "").to_numpy(zero_copy_only=False)
+        except (pa.ArrowException, TypeError, ValueError):
+            return None
 
 
 class FilterPanel(ttk.LabelFrame):
@@ -476,6 +982,8 @@ class UnderlyingTab(ttk.Frame):
     """
     First tab: filter panel + table.
     """
+    POLL_MS = 30  # how often to check for a background filter result
+
     def __init__(self, parent, model: DataModel, logger: TextLogger):
         super().__init__(parent)
         self.model = model
@@ -490,20 +998,38 @@ class UnderlyingTab(ttk.Frame):
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
+        self._shown_view: pd.DataFrame | None = None  # model.view currently in the table
+        self._poll_job: str | None = None  # pending after() while the model filters in background
+
     def on_data_loaded(self):
+        self._shown_view = None
         if self.model.df is None:
             self.table.clear()
             return
         cols = list(self.model.df.columns)
         self.filter_panel.set_columns(cols)
         self.filter_panel.refresh_active_filters()
+        self.table.set_source(self.model.df)
         self._refresh_table()
 
     def _refresh_table(self):
+        if not self.model.poll():
+            if self._poll_job is None:
+                self._poll_job = self.after(self.POLL_MS, self._poll_refresh)
+            return
         if self.model.view is None:
             self.table.clear()
+            self._shown_view = None
             return
-        self.table.set_dataframe(self.model.view)
+        if self.model.view is self._shown_view:
+            # filters didn't change the view; keep the rows already in the tree
+            return
+        self.table.show_rows(self.model.view_rows)
+        self._shown_view = self.model.view
+
+    def _poll_refresh(self):
+        self._poll_job = None
+        self._refresh_table()
 
 
 class NavigationPanel(ttk.Frame):
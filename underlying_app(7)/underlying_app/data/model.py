@@ -1,8 +1,100 @@
 
 from __future__ import annotations
 
+from importlib.util import find_spec
+
+import numpy as np
 import pandas as pd
 
+try:
+    import polars as pl
+except ImportError:  # optional: large-frame filtering falls back to pandas
+    pl = None
+
+# Polars handles the filter scan for frames at least this long (when installed)
+USE_POLARS = pl is not None
+POLARS_MIN_ROWS = 200_000
+
+# Arrow-backed strings (contiguous UTF-8, C lower/contains kernels) when pyarrow is available
+TEXT_DTYPE = "string[pyarrow]" if find_spec("pyarrow") is not None else "string"
+
+try:
+    import pyarrow as pa
+    from numba import njit, prange
+except ImportError:  # optional: contains runs through pandas' str.contains
+    njit = None
+
+# columns at least this long use the parallel numba contains kernel (when available)
+NUMBA_CONTAINS_MIN_ROWS = 100_000
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _contains_kernel(data, offsets, needle, skip, out):
+        """Horspool substring search of `needle` in each UTF-8 slot data[offsets[i]:offsets[i+1]]."""
+        m = needle.size
+        for i in prange(out.size):
+            pos = offsets[i]
+            end = offsets[i + 1]
+            found = False
+            while pos + m <= end:
+                j = m - 1
+                while j >= 0 and data[pos + j] == needle[j]:
+                    j -= 1
+                if j < 0:
+                    found = True
+                    break
+                pos += skip[data[pos + m - 1]]
+            out[i] = found
+
+
+def _numba_contains(s_low: pd.Series, needle: str) -> np.ndarray | None:
+    """
+    Literal contains over the Arrow buffers of a lowercased string[pyarrow] column.
+    Returns None when the kernel doesn't apply (no numba, not Arrow-backed, empty needle).
+    """
+    dtype = s_low.dtype
+    # str() of an Arrow-backed StringDtype is just "string": check the storage instead
+    if njit is None or not needle or not (isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"):
+        return None
+    arr = pa.array(s_low.array)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    if arr.null_count:
+        return None
+    off_type = np.int64 if pa.types.is_large_string(arr.type) else np.int32
+    _, off_buf, data_buf = arr.buffers()
+    offsets = np.frombuffer(off_buf, dtype=off_type)[arr.offset:arr.offset + len(arr) + 1]
+    data = np.frombuffer(data_buf, dtype=np.uint8) if data_buf is not None else np.empty(0, np.uint8)
+
+    pat = np.frombuffer(needle.encode("utf-8"), dtype=np.uint8)
+    skip = np.full(256, pat.size, dtype=np.int64)
+    for k in range(pat.size - 1):
+        skip[pat[k]] = pat.size - 1 - k
+
+    out = np.empty(len(arr), dtype=bool)
+    _contains_kernel(data, offsets, pat, skip, out)
+    return out
+
+
+def downcast_ints(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Integer columns -> smallest int/uint dtype holding their min/max (lossless).
+    Floats are left alone: float32 would change user values. Returns df itself if nothing shrinks.
+    """
+    casts = {}
+    for c in df.columns:
+        s = df[c]
+        if not pd.api.types.is_integer_dtype(s) or isinstance(s.dtype, pd.api.extensions.ExtensionDtype) or s.empty:
+            continue
+        lo, hi = s.min(), s.max()
+        for t in ((np.uint8, np.uint16, np.uint32) if lo >= 0 else (np.int8, np.int16, np.int32)):
+            info = np.iinfo(t)
+            if info.min <= lo and hi <= info.max:
+                if np.dtype(t).itemsize < s.dtype.itemsize:
+                    casts[c] = t
+                break
+    return df.astype(casts) if casts else df
+
 
 class DataModel:
     """
@@ -17,22 +109,34 @@ class DataModel:
         self.view: pd.DataFrame | None = None
         self.col_filters: dict[str, str] = {}
         self.global_search: str = ""
+        # per-column text / lowercased text of df (non-numeric columns), built on first use
+        self._text_cache: dict[str, pd.Series] = {}
+        self._lower_cache: dict[str, pd.Series] = {}
+        # lazy Polars mirror of df for the large-frame path (False: df couldn't be converted)
+        self._lf = None
 
     def set_df(self, df: pd.DataFrame):
-        self.df = df
+        self.df = downcast_ints(df)
         self.col_filters = {c: "All" for c in df.columns}
         self.global_search = ""
-        self.apply_filters()
+        self._text_cache = {}
+        self._lower_cache = {}
+        self._lf = None
+        # fresh state has no active filter: the view is the frame, no scan needed
+        self.view = self.df
 
-    def set_col_filter(self, column: str, text: str):
+    def set_col_filter(self, column: str, text: str, apply: bool = True):
+        """apply=False lets callers batch several filter edits into one apply_filters()."""
         if self.df is None or column not in self.df.columns:
             return
         self.col_filters[column] = text if text else "All"
-        self.apply_filters()
+        if apply:
+            self.apply_filters()
 
-    def set_global_search(self, text: str):
+    def set_global_search(self, text: str, apply: bool = True):
         self.global_search = (text or "").strip()
-        self.apply_filters()
+        if apply:
+            self.apply_filters()
 
     def clear_filters(self):
         if self.df is None:
@@ -42,48 +146,123 @@ class DataModel:
         self.global_search = ""
         self.apply_filters()
 
+    def get_text_column(self, column: str) -> pd.Series:
+        """
+        Column as display text ("" for missing), computed once per df and shared by
+        the filters and the filter-suggestion lists. datetime -> "%Y-%m-%d %H:%M:%S".
+        """
+        s_str = self._text_cache.get(column)
+        if s_str is None:
+            s = self.df[column]
+            if pd.api.types.is_datetime64_any_dtype(s):
+                s = pd.to_datetime(s, errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S")
+            s_str = s.astype(TEXT_DTYPE).fillna("")
+            self._text_cache[column] = s_str
+        return s_str
+
+    def get_text_column_lower(self, column: str) -> pd.Series:
+        """get_text_column() lowercased, cached the same way."""
+        s_low = self._lower_cache.get(column)
+        if s_low is None:
+            s_low = self.get_text_column(column).str.lower()
+            self._lower_cache[column] = s_low
+        return s_low
+
     def apply_filters(self):
         if self.df is None:
             self.view = None
             return
 
         df = self.df
+        if not self.global_search and all(f in ("", "All") for f in self.col_filters.values()):
+            self.view = df
+            return
 
         # Per-column filters (contains match, case-insensitive) for non-numeric columns only
-        for col, filt in self.col_filters.items():
-            if filt in ("", "All"):
-                continue
-            s = df[col]
+        active = [
+            (col, str(filt).lower())
+            for col, filt in self.col_filters.items()
+            if filt not in ("", "All") and not pd.api.types.is_numeric_dtype(df[col])
+        ]
+        ql = self.global_search.lower()
+        text_cols = [c for c in df.columns if not pd.api.types.is_numeric_dtype(df[c])] if ql else []
+        # categoricals first: cheapest to scan, and they may already cover every row
+        text_cols.sort(key=lambda c: not isinstance(df[c].dtype, pd.CategoricalDtype))
 
-            # No filters for numeric columns
-            if pd.api.types.is_numeric_dtype(s):
-                continue
+        if not active and not text_cols:
+            self.view = df
+            return
 
-            # datetime -> compare formatted string
-            if pd.api.types.is_datetime64_any_dtype(s):
-                s_str = pd.to_datetime(s, errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S").fillna("")
-            else:
-                s_str = s.astype("string").fillna("")
-
-            needle = str(filt).lower()
-            df = df[s_str.str.lower().str.contains(needle, na=False)]
-
-        # Global search across all non-numeric columns
-        q = self.global_search
-        if q:
-            ql = q.lower()
-            mask = None
-            for col in df.columns:
-                s = df[col]
-                if pd.api.types.is_numeric_dtype(s):
-                    continue
-                if pd.api.types.is_datetime64_any_dtype(s):
-                    s_str = pd.to_datetime(s, errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S").fillna("")
-                else:
-                    s_str = s.astype("string").fillna("")
-                m = s_str.str.lower().str.contains(ql, na=False)
-                mask = m if mask is None else (mask | m)
-            if mask is not None:
-                df = df[mask]
-
-        self.view = df
+        mask = None
+        # Polars only pays off when some column needs a real text scan (not just categories)
+        scanned = [c for c, _ in active] + text_cols
+        if (USE_POLARS and len(df) >= POLARS_MIN_ROWS
+                and any(not isinstance(df[c].dtype, pd.CategoricalDtype) for c in scanned)):
+            mask = self._polars_mask(active, ql, text_cols)
+        if mask is None:
+            mask = self._pandas_mask(active, ql, text_cols)
+        self.view = df[mask]
+
+    def _pandas_mask(self, active: list[tuple[str, str]], ql: str, text_cols: list[str]) -> np.ndarray:
+        mask = np.ones(len(self.df), dtype=bool)
+        for col, needle in active:
+            np.logical_and(mask, self._contains(col, needle), out=mask)
+
+        # Global search across all non-numeric columns: one OR-accumulated numpy mask
+        if text_cols:
+            hit = np.zeros(len(self.df), dtype=bool)
+            for col in text_cols:
+                np.logical_or(hit, self._contains(col, ql), out=hit)
+                if hit.all():
+                    break
+            np.logical_and(mask, hit, out=mask)
+        return mask
+
+    def _contains(self, column: str, needle: str) -> np.ndarray:
+        """Case-insensitive literal contains on a cached lowered column (needle already lowered)."""
+        s = self.df[column]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            # match the few categories, then map to rows through the integer codes
+            cats = s.cat.categories
+            if isinstance(cats, pd.DatetimeIndex):
+                cats = cats.strftime("%Y-%m-%d %H:%M:%S")
+            hit = cats.astype(TEXT_DTYPE).str.lower().str.contains(needle, regex=False).to_numpy(dtype=bool)
+            # code -1 (missing) reads as "" like in the lowered column
+            return np.append(hit, needle == "")[s.cat.codes.to_numpy()]
+
+        s_low = self.get_text_column_lower(column)
+        if len(s_low) >= NUMBA_CONTAINS_MIN_ROWS:
+            m = _numba_contains(s_low, needle)
+            if m is not None:
+                return m
+        return s_low.str.contains(needle, na=False, regex=False).to_numpy(dtype=bool)
+
+    def _polars_mask(self, active: list[tuple[str, str]], ql: str, text_cols: list[str]) -> np.ndarray | None:
+        """
+        Same filters as one lazy Polars scan over a mirror of df (multi-threaded).
+        Returns None if the frame can't be mirrored; the pandas path is used then.
+        """
+        if self._lf is None:
+            try:
+                self._lf = pl.from_pandas(self.df).lazy()
+            except Exception:
+                self._lf = False  # don't retry for this df
+        if self._lf is False:
+            return None
+
+        schema = self._lf.collect_schema()
+
+        def text(col: str):
+            e = pl.col(col)
+            if schema[col].is_temporal():
+                e = e.dt.strftime("%Y-%m-%d %H:%M:%S")
+            return e.cast(pl.Utf8).fill_null("").str.to_lowercase()
+
+        exprs = [text(col).str.contains(needle, literal=True) for col, needle in active]
+        if text_cols:
+            exprs.append(pl.any_horizontal([text(c).str.contains(ql, literal=True) for c in text_cols]))
+        try:
+            out = self._lf.select(pl.all_horizontal(exprs).alias("m")).collect()
+        except Exception:
+            return None
+        return out["m"].to_numpy()
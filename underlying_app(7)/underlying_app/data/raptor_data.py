@@ -4,6 +4,14 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from .model import TEXT_DTYPE
+
+
+def _random_categorical(rng: np.random.Generator, categories: list[str], n: int) -> pd.Categorical:
+    # uniform pick as int8 codes: no object array, no factorize pass
+    codes = rng.integers(0, len(categories), size=n, dtype=np.int8)
+    return pd.Categorical.from_codes(codes, categories=categories)
+
 
 def make_fake_raptor_from_underlyings(underlyings: pd.DataFrame, n_rows: int = 1_000_000, seed: int = 123) -> pd.DataFrame:
     """
@@ -40,9 +48,9 @@ def make_fake_raptor_from_underlyings(underlyings: pd.DataFrame, n_rows: int = 1
     underlying_isin = isin[pick]
     underlying_wkn = wkn[pick]
 
-    # scheine identifiers (fake)
-    # keep as strings but later convert to category for memory
-    scheme_id = np.array([f"SC{seed:03d}{i:07d}" for i in range(n_rows)], dtype=object)
+    # scheine identifiers (fake): unique, so a compact string array rather than a category
+    suffix = np.char.zfill(np.arange(n_rows).astype(str), 7)
+    scheme_id = pd.array(np.char.add(f"SC{seed:03d}", suffix), dtype=TEXT_DTYPE)
 
     # dates (as datetime64)
     start = np.datetime64("2024-01-01")
@@ -54,39 +62,40 @@ def make_fake_raptor_from_underlyings(underlyings: pd.DataFrame, n_rows: int = 1
         "scheme_id": scheme_id,
         "underlying_isin": underlying_isin,
         "underlying_wkn": underlying_wkn,
-        "issuer": rng.choice(["BNP", "SG", "HSBC", "CITI", "UBS", "DB"], size=n_rows),
-        "currency": rng.choice(["EUR", "USD", "GBP"], size=n_rows),
-        "type": rng.choice(["Call", "Put", "Turbo", "KO", "Discount"], size=n_rows),
+        "issuer": _random_categorical(rng, ["BNP", "SG", "HSBC", "CITI", "UBS", "DB"], n_rows),
+        "currency": _random_categorical(rng, ["EUR", "USD", "GBP"], n_rows),
+        "type": _random_categorical(rng, ["Call", "Put", "Turbo", "KO", "Discount"], n_rows),
         "maturity": pd.to_datetime(maturity),
 
-        "strike": np.round(rng.lognormal(3.4, 0.35, size=n_rows), 2),
-        "leverage": np.round(rng.uniform(1.0, 25.0, size=n_rows), 2),
-        "barrier": np.round(rng.lognormal(3.35, 0.40, size=n_rows), 2),
-        "open_interest": rng.integers(0, 200000, size=n_rows),
-        "volume_1d": rng.integers(0, 50000, size=n_rows),
-        "spread_bps": np.round(rng.uniform(5, 250, size=n_rows), 1),
-        "iv_30d": np.round(rng.uniform(0.10, 1.20, size=n_rows), 4),
-        "delta": np.round(rng.uniform(-1, 1, size=n_rows), 4),
-        "gamma": np.round(rng.uniform(0, 0.5, size=n_rows), 5),
-        "vega": np.round(rng.uniform(0, 2.0, size=n_rows), 5),
-        "theta": np.round(rng.uniform(-2.0, 0.0, size=n_rows), 5),
-        "rho": np.round(rng.uniform(-1.0, 1.0, size=n_rows), 5),
-
-        "px_bid": np.round(rng.lognormal(0.0, 0.6, size=n_rows), 3),
-        "px_ask": np.round(rng.lognormal(0.0, 0.6, size=n_rows) + 0.02, 3),
-        "px_last": np.round(rng.lognormal(0.0, 0.6, size=n_rows), 3),
+        # prices/greeks are rounded to <= 5 decimals, float32 is plenty; counts fit in 32/8 bits
+        "strike": np.round(rng.lognormal(3.4, 0.35, size=n_rows), 2).astype(np.float32),
+        "leverage": np.round(rng.uniform(1.0, 25.0, size=n_rows), 2).astype(np.float32),
+        "barrier": np.round(rng.lognormal(3.35, 0.40, size=n_rows), 2).astype(np.float32),
+        "open_interest": rng.integers(0, 200000, size=n_rows, dtype=np.int32),
+        "volume_1d": rng.integers(0, 50000, size=n_rows, dtype=np.int32),
+        "spread_bps": np.round(rng.uniform(5, 250, size=n_rows), 1).astype(np.float32),
+        "iv_30d": np.round(rng.uniform(0.10, 1.20, size=n_rows), 4).astype(np.float32),
+        "delta": np.round(rng.uniform(-1, 1, size=n_rows), 4).astype(np.float32),
+        "gamma": np.round(rng.uniform(0, 0.5, size=n_rows), 5).astype(np.float32),
+        "vega": np.round(rng.uniform(0, 2.0, size=n_rows), 5).astype(np.float32),
+        "theta": np.round(rng.uniform(-2.0, 0.0, size=n_rows), 5).astype(np.float32),
+        "rho": np.round(rng.uniform(-1.0, 1.0, size=n_rows), 5).astype(np.float32),
+
+        "px_bid": np.round(rng.lognormal(0.0, 0.6, size=n_rows), 3).astype(np.float32),
+        "px_ask": np.round(rng.lognormal(0.0, 0.6, size=n_rows) + 0.02, 3).astype(np.float32),
+        "px_last": np.round(rng.lognormal(0.0, 0.6, size=n_rows), 3).astype(np.float32),
 
         "is_listed": rng.choice([True, False], size=n_rows, p=[0.97, 0.03]),
-        "risk_bucket": rng.integers(1, 6, size=n_rows),
+        "risk_bucket": rng.integers(1, 6, size=n_rows, dtype=np.uint8),
         "updated_at": pd.Timestamp.now().floor("s"),
     })
 
     # Add filler numeric columns to reach ~40 columns
     for k in range(1, 41 - df.shape[1] + 1):
-        df[f"metric_{k:02d}"] = np.round(rng.normal(0.0, 1.0, size=n_rows), 4)
+        df[f"metric_{k:02d}"] = np.round(rng.normal(0.0, 1.0, size=n_rows), 4).astype(np.float32)
 
     # Make some string columns categorical to reduce memory footprint
-    for c in ["scheme_id", "underlying_isin", "underlying_wkn", "issuer", "currency", "type"]:
+    for c in ["underlying_isin", "underlying_wkn"]:
         if c in df.columns:
             df[c] = df[c].astype("category")
 
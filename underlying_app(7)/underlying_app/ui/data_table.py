@@ -1,13 +1,51 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date
+from typing import Callable
 
+import numpy as np
 import pandas as pd
 import tkinter as tk
 from tkinter import ttk
 
 
+# numeric -> right, datetime -> center, other -> left
+NUMERIC_KINDS = ("bool", "int", "float", "num")
+_ANCHORS = {"datetime": "center", "bool": "e", "int": "e", "float": "e", "num": "e"}
+
+
+def dtype_kind(s: pd.Series) -> str:
+    """Coarse dtype class: datetime, bool, int, float, num (other numeric), category or str."""
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return "datetime"
+    if pd.api.types.is_bool_dtype(s):
+        return "bool"
+    if pd.api.types.is_integer_dtype(s):
+        return "int"
+    if pd.api.types.is_float_dtype(s):
+        return "float"
+    if pd.api.types.is_numeric_dtype(s):
+        return "num"
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return "category"
+    return "str"
+
+
+def _format_datetime_col(s: pd.Series) -> list[str]:
+    return pd.to_datetime(s, errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S").fillna("").tolist()
+
+
+def _format_text_col(s: pd.Series) -> list[str]:
+    # numbers keep str() formatting ("3.0", "True"); NaN/None -> ""
+    return s.astype("string").fillna("").tolist()
+
+
+def _tcl_quote(v: str) -> str:
+    # double-quoted Tcl word: escape what is special inside quotes (\\ " [ $)
+    return '"' + v.replace("\\", "\\\\").replace('"', '\\"').replace("[", "\\[").replace("$", "\\$") + '"'
+
+
 class DataTable(ttk.Frame):
     """
     Generic Treeview table for any pandas DataFrame.
@@ -22,6 +60,8 @@ class DataTable(ttk.Frame):
     - Auto-fit column widths to show full content (may require horizontal scroll)
       * Uses full column for typical sizes, and safe sampling for very large frames.
     - Highlights rows where EventNext's DATE == today (if column exists)
+    - Virtual scrolling for long frames: only the rows in the viewport exist as Treeview
+      items; scrolling deletes/inserts just the rows entering or leaving the window.
     """
     BIG_DF_ROW_THRESHOLD = 20000     # beyond this, we sample for width to keep UI responsive
     SAMPLE_FOR_WIDTH = 5000          # sample size if very large
@@ -29,14 +69,17 @@ class DataTable(ttk.Frame):
     PADDING_PX = 24                  # extra padding per column
     MIN_PX = 80
     MAX_PX = 1200                    # allow very wide columns if needed, but keep somewhat sane
+    VIRTUAL_ROW_THRESHOLD = 1000     # above this many rows, only the visible window is inserted
+    ROW_PX = 24                      # fallback row height if the style doesn't report one
+    INSERT_BATCH = 500               # rows per Tcl script when bulk-inserting
 
     def __init__(self, parent: tk.Misc):
         super().__init__(parent, style="Panel.TFrame")
 
         self.tree = ttk.Treeview(self, columns=(), show="headings")
-        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self._on_vscroll)
         self.hsb = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=self.vsb.set, xscrollcommand=self.hsb.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=self.hsb.set)
 
         self.tree.grid(row=0, column=0, sticky="nsew")
         self.vsb.grid(row=0, column=1, sticky="ns")
@@ -50,45 +93,45 @@ class DataTable(ttk.Frame):
         self._df: pd.DataFrame | None = None
         self._sort_col: str | None = None
         self._sort_asc: bool = True
+        self._formatters: dict[str, Callable[[pd.Series], list[str]]] = {}
+        self._dtype_info: dict[str, tuple[str, str]] = {}  # col -> (dtype kind, anchor)
+        self._content_len: dict[str, int] = {}  # measured content width (chars) per column
+
+        # virtual mode: all formatted rows, which of them are inserted (row -> item id)
+        self._rows: list[tuple] | None = None
+        self._today_mask: np.ndarray | None = None
+        self._items: dict[int, str] = {}
+        self._first_row = 0
+
+        self.tree.bind("<Configure>", lambda _e: self._render_window())
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_wheel)
 
     def set_dataframe(self, df: pd.DataFrame):
-        self._df = df.copy()
+        # adopt the caller's frame; sorting builds a reordered frame, never mutates it
+        self._df = df
         self._sort_col = None
         self._sort_asc = True
+        # dtypes don't change on sort: classify columns and pick formatters once per frame
+        self._dtype_info = {}
+        for c in df.columns:
+            kind = dtype_kind(df[c])
+            self._dtype_info[c] = (kind, _ANCHORS.get(kind, "w"))
+        self._formatters = {c: self._pick_formatter(kind) for c, (kind, _) in self._dtype_info.items()}
+        self._content_len = {}
         self._rebuild_columns(self._df)
         self._populate_rows(self._df)
         self.autofit_columns()
 
     def clear(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._clear_rows()
         self.tree["columns"] = ()
         self._df = None
         self._sort_col = None
         self._sort_asc = True
 
-    def _col_anchor_for_dtype(self, s: pd.Series) -> str:
-        if pd.api.types.is_numeric_dtype(s):
-            return "e"
-        if pd.api.types.is_datetime64_any_dtype(s):
-            return "center"
-        return "w"
-
-    def _format_value(self, v):
-        # Robust formatting for NaN/None/empty strings/0/etc
-        if v is None:
-            return ""
-        try:
-            if pd.isna(v):
-                return ""
-        except Exception:
-            pass
-        if isinstance(v, (pd.Timestamp, datetime)):
-            try:
-                return pd.to_datetime(v).strftime("%Y-%m-%d %H:%M:%S")
-            except Exception:
-                return str(v)
-        return str(v)
+    def _col_anchor(self, col: str) -> str:
+        return self._dtype_info[col][1]
 
     def _heading_text(self, col: str) -> str:
         if self._sort_col != col:
@@ -101,7 +144,7 @@ class DataTable(ttk.Frame):
 
         for c in cols:
             self.tree.heading(c, text=self._heading_text(c), command=lambda col=c: self._on_heading_click(col))
-            anchor = self._col_anchor_for_dtype(df[c])
+            anchor = self._col_anchor(c)
             # stretch=False => keep fitted width; horizontal scroll shows the rest
             self.tree.column(c, width=120, anchor=anchor, stretch=False)
 
@@ -123,17 +166,19 @@ class DataTable(ttk.Frame):
 
         s = self._df[col]
         asc = self._sort_asc
+        kind = self._dtype_info[col][0]
 
         try:
-            if pd.api.types.is_datetime64_any_dtype(s):
+            if kind == "datetime":
                 key = pd.to_datetime(s, errors="coerce")
-            elif pd.api.types.is_numeric_dtype(s):
+            elif kind in NUMERIC_KINDS:
                 key = pd.to_numeric(s, errors="coerce")
             else:
                 key = s.astype("string").fillna("").str.lower()
 
-            order = key.sort_values(ascending=asc, na_position="last").index
-            self._df = self._df.loc[order]
+            # positional order: take() is a single gather, unlike .loc label lookup
+            order = key.reset_index(drop=True).sort_values(ascending=asc, na_position="last", kind="stable").index.to_numpy()
+            self._df = self._df.take(order)
         except Exception:
             self._df = self._df.sort_values(by=col, ascending=asc, kind="mergesort")
 
@@ -141,68 +186,158 @@ class DataTable(ttk.Frame):
         self._populate_rows(self._df)
         self.autofit_columns()
 
+    def _clear_rows(self):
+        self.tree.delete(*self.tree.get_children())
+        self._rows = None
+        self._today_mask = None
+        self._items = {}
+        self._first_row = 0
+
     def _populate_rows(self, df: pd.DataFrame):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._clear_rows()
 
         if df is None or df.empty:
             return
 
-        today = date.today()
-        has_eventnext = "EventNext" in df.columns
+        # Format column-wise (one dtype dispatch per column), then zip into rows
+        cols_str = [self._formatters[c](df[c]) for c in df.columns]
 
-        for _, row in df.iterrows():
-            values = [self._format_value(row[c]) for c in df.columns]
-            tags = ()
+        # "today" highlight for all rows at once
+        if "EventNext" in df.columns:
+            ev = pd.to_datetime(df["EventNext"], errors="coerce")
+            today_mask = (ev.dt.normalize() == pd.Timestamp(date.today(), tz=ev.dt.tz)).to_numpy()
+        else:
+            today_mask = np.zeros(len(df), dtype=bool)
+
+        if len(df) > self.VIRTUAL_ROW_THRESHOLD:
+            self._rows = list(zip(*cols_str))
+            self._today_mask = today_mask
+            self._render_window()
+            return
 
-            if has_eventnext:
-                try:
-                    ev = pd.to_datetime(row["EventNext"], errors="coerce")
-                    if pd.notna(ev) and ev.date() == today:
-                        tags = ("event_today",)
-                except Exception:
-                    pass
+        self._insert_rows(zip(*cols_str), today_mask)
 
-            self.tree.insert("", "end", values=values, tags=tags)
+    def _insert_rows(self, rows, today_mask: np.ndarray):
+        """
+        Appends rows with one Tcl eval per INSERT_BATCH rows instead of one
+        tree.insert() round trip per row.
+        """
+        tree = str(self.tree)
+        lines = []
+        for values, is_today in zip(rows, today_mask):
+            vals = " ".join(_tcl_quote(v) for v in values)
+            tags = " -tags event_today" if is_today else ""
+            lines.append(f"{tree} insert {{}} end -values [list {vals}]{tags}")
+            if len(lines) >= self.INSERT_BATCH:
+                self.tk.eval("\n".join(lines))
+                lines.clear()
+        if lines:
+            self.tk.eval("\n".join(lines))
+
+    # ---------------- Virtual scrolling ----------------
+    def _visible_rows(self) -> int:
+        try:
+            row_px = int(ttk.Style(self).lookup("Treeview", "rowheight") or self.ROW_PX)
+        except (tk.TclError, ValueError):
+            row_px = self.ROW_PX
+        height = self.tree.winfo_height()
+        if height <= 1:
+            # not mapped yet; <Configure> re-renders with the real size
+            return 50
+        return max(1, height // row_px)
+
+    def _render_window(self):
+        if self._rows is None:
+            return
+        n = len(self._rows)
+        page = self._visible_rows()
+        start = max(0, min(self._first_row, n - page))
+        end = min(n, start + page)
+        self._first_row = start
+
+        # drop rows that left the window, insert only the ones that entered it
+        stale = [i for i in self._items if i < start or i >= end]
+        if stale:
+            self.tree.delete(*[self._items.pop(i) for i in stale])
+        for i in range(start, end):
+            if i not in self._items:
+                tags = ("event_today",) if self._today_mask[i] else ()
+                self._items[i] = self.tree.insert("", i - start, values=self._rows[i], tags=tags)
+        self.vsb.set(start / n, end / n)
+
+    def _on_vscroll(self, *args):
+        if self._rows is None:
+            self.tree.yview(*args)
+            return
+        if args[0] == "moveto":
+            self._first_row = int(float(args[1]) * len(self._rows))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self._first_row += step * self._visible_rows() if args[2] == "pages" else step
+        self._render_window()
+
+    def _on_tree_yscroll(self, first, last):
+        # in virtual mode the scrollbar tracks the window, not the tree's own items
+        if self._rows is None:
+            self.vsb.set(first, last)
+
+    def _on_wheel(self, event):
+        if self._rows is None:
+            return None
+        up = event.num == 4 or event.delta > 0
+        self._first_row += -3 if up else 3
+        self._render_window()
+        return "break"
+
+    def _pick_formatter(self, kind: str) -> Callable[[pd.Series], list[str]]:
+        """Column formatter chosen once from the dtype kind; each runs on the whole column."""
+        if kind == "datetime":
+            return _format_datetime_col
+        return _format_text_col
 
     def autofit_columns(self):
         """
         Fit columns to show full content (header + cell values).
         Uses all rows for typical dataframes; for very large ones uses sampling.
+        Content widths are measured once per dataframe; sorting only reorders rows,
+        so later calls just combine the cached widths with the (arrow) header text.
         """
         df = self._df
         if df is None or df.empty:
             return
 
-        # Choose data for width computation
-        if len(df) > self.BIG_DF_ROW_THRESHOLD:
-            sample = df.sample(n=min(self.SAMPLE_FOR_WIDTH, len(df)), random_state=0)
-        else:
-            sample = df  # full
+        missing = [c for c in df.columns if c not in self._content_len]
+        if missing:
+            # Choose data for width computation
+            if len(df) > self.BIG_DF_ROW_THRESHOLD:
+                sample = df.sample(n=min(self.SAMPLE_FOR_WIDTH, len(df)), random_state=0)
+            else:
+                sample = df  # full
+            for c in missing:
+                self._content_len[c] = self._measure_content(sample[c], self._dtype_info[c][0])
 
         for c in df.columns:
-            header_len = len(self._heading_text(c))
-            max_len = header_len
-
-            try:
-                # Use vectorized conversion for speed & robustness
-                if pd.api.types.is_datetime64_any_dtype(sample[c]):
-                    s_str = pd.to_datetime(sample[c], errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S")
-                    s_str = s_str.fillna("")
-                else:
-                    # string dtype handles NaN -> <NA> so we fill to ""
-                    s_str = sample[c].astype("string").fillna("")
-
-                # include empty/0 properly; lengths compute ok
-                m = s_str.map(len).max()
-                if pd.notna(m):
-                    max_len = max(max_len, int(m))
-            except Exception:
-                pass
-
+            max_len = max(len(self._heading_text(c)), self._content_len[c])
             px = int(max_len * self.CHAR_PX + self.PADDING_PX)
             px = max(self.MIN_PX, min(self.MAX_PX, px))
 
             # keep current anchor
-            anchor = self._col_anchor_for_dtype(df[c])
+            anchor = self._col_anchor(c)
             self.tree.column(c, width=px, anchor=anchor, stretch=False)
+
+    def _measure_content(self, s: pd.Series, kind: str) -> int:
+        """Longest display string in the column (0 if it can't be measured)."""
+        try:
+            if kind == "category":
+                # straight from the categories, no per-row strings
+                cats = s.cat.categories.astype("string")
+                m = cats.str.len().max() if len(cats) else 0
+            elif kind == "datetime":
+                # fixed format: "%Y-%m-%d %H:%M:%S" is 19 chars, NaT is ""
+                m = 19 if s.notna().any() else 0
+            else:
+                # string dtype handles NaN -> <NA> so we fill to ""
+                m = s.astype("string").fillna("").str.len().max()
+            return int(m) if pd.notna(m) else 0
+        except Exception:
+            return 0
@@ -7,7 +7,7 @@ from tkinter import ttk
 import pandas as pd
 
 from ..data.model import DataModel
-from .data_table import DataTable
+from .data_table import NUMERIC_KINDS, DataTable, dtype_kind
 
 
 class DataView(ttk.Frame):
@@ -49,10 +49,13 @@ class DataView(ttk.Frame):
         self.stats_sample_rows = stats_sample_rows
 
         self._df: pd.DataFrame | None = None
+        self._dtype_info: dict[str, str] = {}
         self._wrap_per_row = 6
         self._pending_job: str | None = None
 
         self._uniques_cache: dict[str, list[str]] = {}
+        self._uniques_lower_cache: dict[str, list[str]] = {}
+        self._suggest_jobs: dict[str, str] = {}
         self._filter_vars: dict[str, tk.StringVar] = {}
         self._filter_widgets: dict[str, ttk.Combobox] = {}
 
@@ -101,25 +104,14 @@ class DataView(ttk.Frame):
 
     def set_dataframe(self, df: pd.DataFrame):
         self._df = df
+        # dtype kind per column, once per frame (filter-area rebuilds on resize reuse it)
+        self._dtype_info = {c: dtype_kind(df[c]) for c in df.columns}
         self.model.set_df(df)
         if self.enable_filters:
             self._build_filter_area(df)
         self._refresh()
 
     # ---------------- Dtypes & layout ----------------
-    def _dtype_tag(self, s: pd.Series) -> str:
-        if pd.api.types.is_datetime64_any_dtype(s):
-            return "datetime"
-        if pd.api.types.is_bool_dtype(s):
-            return "bool"
-        if pd.api.types.is_integer_dtype(s):
-            return "int"
-        if pd.api.types.is_float_dtype(s):
-            return "float"
-        if pd.api.types.is_categorical_dtype(s):
-            return "category"
-        return "str"
-
     def _compute_wrap(self, width_px: int) -> int:
         if width_px <= 1:
             return self._wrap_per_row
@@ -141,7 +133,11 @@ class DataView(ttk.Frame):
         for w in self.filters_frame.winfo_children():
             w.destroy()
 
+        for job in self._suggest_jobs.values():
+            self.after_cancel(job)
+        self._suggest_jobs.clear()
         self._uniques_cache.clear()
+        self._uniques_lower_cache.clear()
         self._filter_vars.clear()
         self._filter_widgets.clear()
 
@@ -181,21 +177,22 @@ class DataView(ttk.Frame):
         # Column filters (non-numeric only)
         for col in df.columns:
             s = df[col]
-            if pd.api.types.is_numeric_dtype(s):
+            dtype = self._dtype_info[col]
+            if dtype in NUMERIC_KINDS:
                 continue
 
             box = ttk.Frame(self.filters_frame, style="Panel.TFrame")
             box.grid(row=r, column=c, padx=6, pady=6, sticky="w")
 
-            dtype = self._dtype_tag(s)
             ttk.Label(box, text=str(col), style="Muted.TLabel").grid(row=0, column=0, sticky="w")
             ttk.Label(box, text=f"[{dtype}]", style="Muted.TLabel").grid(row=0, column=1, sticky="w", padx=(6, 0))
 
             var = tk.StringVar(value="All")
             cb = ttk.Combobox(box, textvariable=var, state="normal", width=18)
 
-            uniques = self._compute_uniques(s)
+            uniques = self._compute_uniques(col, s)
             self._uniques_cache[col] = uniques
+            self._uniques_lower_cache[col] = [v.lower() for v in uniques]
             cb["values"] = ["All"] + uniques[:self.SUGGESTIONS_MAX]
             cb.grid(row=1, column=0, columnspan=2, sticky="w", pady=(2, 0))
 
@@ -210,27 +207,43 @@ class DataView(ttk.Frame):
                 c = 0
                 r += 1
 
-    def _compute_uniques(self, s: pd.Series) -> list[str]:
-        if pd.api.types.is_datetime64_any_dtype(s):
-            s2 = pd.to_datetime(s, errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S").fillna("")
-        else:
-            s2 = s.astype("string").fillna("")
-        vals = pd.unique(s2)
+    def _compute_uniques(self, col: str, s: pd.Series) -> list[str]:
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            # categories already are the distinct values: no scan over the rows
+            cats = s.cat.categories.astype("string")
+            return sorted(v for v in cats.tolist() if v not in ("", "<NA>", "nan", "NaN") and not pd.isna(v))
+        if pd.api.types.is_bool_dtype(s):
+            return ["False", "True"]
+        # same cached text the model filters on (no second string cast of the column)
+        vals = pd.unique(self.model.get_text_column(col))
         vals = [v for v in vals if v not in ("", "<NA>", "nan", "NaN")]
         return sorted(vals)
 
     def _on_col_typed(self, col: str, var: tk.StringVar, widget: ttk.Combobox):
+        # suggestions are rescanned at most once per DEBOUNCE_MS of typing
+        job = self._suggest_jobs.pop(col, None)
+        if job is not None:
+            self.after_cancel(job)
+        self._suggest_jobs[col] = self.after(self.DEBOUNCE_MS, self._update_suggestions, col, var, widget)
+        self._debounced_apply()
+
+    def _update_suggestions(self, col: str, var: tk.StringVar, widget: ttk.Combobox):
+        self._suggest_jobs.pop(col, None)
         txt = (var.get() or "").strip()
         base = self._uniques_cache.get(col, [])
 
         if not txt or txt == "All":
             widget["values"] = ["All"] + base[:self.SUGGESTIONS_MAX]
-        else:
-            q = txt.lower()
-            matches = [v for v in base if q in v.lower()]
-            widget["values"] = ["All"] + matches[:self.SUGGESTIONS_MAX]
+            return
 
-        self._debounced_apply()
+        q = txt.lower()
+        matches = []
+        for low, v in zip(self._uniques_lower_cache.get(col, []), base):
+            if q in low:
+                matches.append(v)
+                if len(matches) >= self.SUGGESTIONS_MAX:
+                    break
+        widget["values"] = ["All"] + matches
 
     def _on_col_selected(self, col: str, selected: str):
         self.model.set_col_filter(col, selected)
@@ -247,9 +260,11 @@ class DataView(ttk.Frame):
 
     def _apply_filters_now(self):
         self._pending_job = None
+        # stage every widget's value, then filter once
         for col, var in self._filter_vars.items():
-            self.model.set_col_filter(col, var.get())
-        self.model.set_global_search(getattr(self, "search_var", tk.StringVar()).get())
+            self.model.set_col_filter(col, var.get(), apply=False)
+        self.model.set_global_search(getattr(self, "search_var", tk.StringVar()).get(), apply=False)
+        self.model.apply_filters()
         self._refresh()
 
     def _clear_filters(self):
@@ -279,9 +294,9 @@ class DataView(ttk.Frame):
         num_cols = int(sample.select_dtypes(include="number").shape[1])
         dt_cols = int(sample.select_dtypes(include=["datetime64[ns]", "datetime64[ns, UTC]"]).shape[1])
         cat_cols = int(sample.select_dtypes(include=["category"]).shape[1])
-        # non-null % on sample
+        # non-null % on sample: per-column non-null counts, no boolean frame
         try:
-            nonnull = float(sample.notna().mean().mean() * 100)
+            nonnull = 100.0 * float(sample.count().sum()) / max(1, sample.size)
         except Exception:
             nonnull = 0.0
 
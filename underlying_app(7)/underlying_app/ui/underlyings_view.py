@@ -6,6 +6,11 @@ from tkinter import ttk
 
 import pandas as pd
 
+try:
+    import pyarrow.compute as pc
+except ImportError:  # optional: uniques go through pd.unique
+    pc = None
+
 from ..data.model import DataModel
 from .data_table import DataTable
 
@@ -28,6 +33,9 @@ class UnderlyingsView(ttk.Frame):
     TILE_W_PX = 240   # approximate tile width used to compute wrap columns
     MIN_WRAP = 2
     MAX_WRAP = 8
+    RESIZE_DEBOUNCE_MS = 150
+    REFRESH_DEBOUNCE_MS = 100  # typing pause before filters are re-applied
+    _KIND_TAGS = {"M": "datetime", "b": "bool", "i": "int", "u": "int", "f": "float"}
 
     def __init__(self, parent: tk.Misc, model: DataModel, on_log):
         super().__init__(parent, style="Panel.TFrame")
@@ -38,6 +46,14 @@ class UnderlyingsView(ttk.Frame):
         self._wrap_per_row = 6
 
         self._uniques_cache: dict[str, list[str]] = {}
+        # (id(df), col) -> sorted suggestions; filled once per set_dataframe, reused by rebuilds
+        self._uniques_global: dict[tuple[int, str], list[str]] = {}
+        self._dtype_tags: dict[str, str] = {}
+        # filter edits only stage values in the model; one scheduled refresh applies them
+        self._dirty = False
+        self._refresh_job: str | None = None
+        self._resize_job: str | None = None
+        self._resize_width = 0
         self._filter_vars: dict[str, tk.StringVar] = {}
         self._filter_widgets: dict[str, ttk.Combobox] = {}
 
@@ -56,6 +72,7 @@ class UnderlyingsView(ttk.Frame):
 
         # rebuild filters when the available width changes (maximize/minimize)
         self.filters_frame.bind("<Configure>", self._on_filters_resize)
+        self._tiles: ttk.Frame | None = None  # current filter tiles, child of filters_frame
 
         self.table = DataTable(self)
         self.table.grid(row=2, column=0, sticky="nsew", padx=12, pady=(0, 12))
@@ -66,21 +83,18 @@ class UnderlyingsView(ttk.Frame):
     def set_dataframe(self, df: pd.DataFrame):
         self._df = df
         self.model.set_df(df)
+        self._dtype_tags = {c: self._dtype_tag(df[c]) for c in df.columns}
+        self._uniques_global.clear()
+        for col, s in df.select_dtypes(exclude="number").items():
+            self._uniques_global[(id(df), col)] = self._compute_uniques(s)
         self._build_filter_area(df)
         self._refresh()
 
     def _dtype_tag(self, s: pd.Series) -> str:
-        if pd.api.types.is_datetime64_any_dtype(s):
-            return "datetime"
-        if pd.api.types.is_bool_dtype(s):
-            return "bool"
-        if pd.api.types.is_integer_dtype(s):
-            return "int"
-        if pd.api.types.is_float_dtype(s):
-            return "float"
-        if pd.api.types.is_categorical_dtype(s):
+        # one attribute read instead of a chain of pd.api.types checks
+        if isinstance(s.dtype, pd.CategoricalDtype):
             return "category"
-        return "str"
+        return self._KIND_TAGS.get(getattr(s.dtype, "kind", "O"), "str")
 
     def _compute_wrap(self, width_px: int) -> int:
         if width_px <= 1:
@@ -91,15 +105,26 @@ class UnderlyingsView(ttk.Frame):
     def _on_filters_resize(self, evt):
         if self._df is None:
             return
-        new_wrap = self._compute_wrap(evt.width)
+        # a window drag fires many <Configure> events: only act on the last one
+        self._resize_width = evt.width
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(self.RESIZE_DEBOUNCE_MS, self._maybe_rebuild)
+
+    def _maybe_rebuild(self):
+        self._resize_job = None
+        if self._df is None:
+            return
+        new_wrap = self._compute_wrap(self._resize_width)
         if new_wrap != self._wrap_per_row:
             self._wrap_per_row = new_wrap
             # rebuild with the new wrap
             self._build_filter_area(self._df)
 
     def _build_filter_area(self, df: pd.DataFrame):
-        for w in self.filters_frame.winfo_children():
-            w.destroy()
+        # build into a fresh, unmanaged frame and swap it in at the end: Tk does one
+        # destroy for all old tiles and one geometry change instead of one per widget
+        tiles = ttk.Frame(self.filters_frame, style="Panel.TFrame")
 
         self._uniques_cache.clear()
         self._filter_vars.clear()
@@ -110,7 +135,7 @@ class UnderlyingsView(ttk.Frame):
         WRAP = self._wrap_per_row
 
         # Global search tile
-        search_box = ttk.Frame(self.filters_frame, style="Panel.TFrame")
+        search_box = ttk.Frame(tiles, style="Panel.TFrame")
         search_box.grid(row=r, column=c, padx=6, pady=6, sticky="w")
 
         ttk.Label(search_box, text="Search", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
@@ -127,7 +152,7 @@ class UnderlyingsView(ttk.Frame):
             r += 1
 
         # Clear button tile
-        clear_box = ttk.Frame(self.filters_frame, style="Panel.TFrame")
+        clear_box = ttk.Frame(tiles, style="Panel.TFrame")
         clear_box.grid(row=r, column=c, padx=6, pady=6, sticky="w")
         ttk.Label(clear_box, text=" ", style="Muted.TLabel").grid(row=0, column=0, sticky="w")
         self.clear_btn = ttk.Button(clear_box, text="Clear", style="Accent.TButton", command=self._clear_filters)
@@ -144,17 +169,19 @@ class UnderlyingsView(ttk.Frame):
             if pd.api.types.is_numeric_dtype(s):
                 continue
 
-            box = ttk.Frame(self.filters_frame, style="Panel.TFrame")
+            box = ttk.Frame(tiles, style="Panel.TFrame")
             box.grid(row=r, column=c, padx=6, pady=6, sticky="w")
 
-            dtype = self._dtype_tag(s)
+            dtype = self._dtype_tags.get(col) or self._dtype_tag(s)
             ttk.Label(box, text=str(col), style="Muted.TLabel").grid(row=0, column=0, sticky="w")
             ttk.Label(box, text=f"[{dtype}]", style="Muted.TLabel").grid(row=0, column=1, sticky="w", padx=(6, 0))
 
             var = tk.StringVar(value="All")
             cb = ttk.Combobox(box, textvariable=var, state="normal", width=18)
 
-            uniques = self._compute_uniques(s)
+            uniques = self._uniques_global.get((id(df), col))
+            if uniques is None:
+                uniques = self._uniques_global[(id(df), col)] = self._compute_uniques(s)
             self._uniques_cache[col] = uniques
             cb["values"] = ["All"] + uniques[:self.SUGGESTIONS_MAX]
             cb.grid(row=1, column=0, columnspan=2, sticky="w", pady=(2, 0))
@@ -170,15 +197,24 @@ class UnderlyingsView(ttk.Frame):
                 c = 0
                 r += 1
 
+        if self._tiles is not None:
+            self._tiles.destroy()
+        tiles.grid(row=0, column=0, sticky="ew")
+        self._tiles = tiles
+
     def _compute_uniques(self, s: pd.Series) -> list[str]:
-        # Robust unique extraction: treat NaN/None/empty as empty and exclude them from suggestions
+        # Robust unique extraction: NaN/None are dropped up front, empty strings excluded from suggestions
+        if pc is not None and isinstance(s.dtype, pd.StringDtype) and s.dtype.storage == "pyarrow":
+            # Arrow kernel on the column's own buffers; no Python objects per row
+            vals = pc.unique(s.array.__arrow_array__()).drop_null().to_pylist()
+            return sorted(v for v in vals if v not in ("", "<NA>", "nan", "NaN"))
+        s = s.dropna()
         if pd.api.types.is_datetime64_any_dtype(s):
-            s2 = pd.to_datetime(s, errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S").fillna("")
+            vals = pd.unique(pd.to_datetime(s).dt.strftime("%Y-%m-%d %H:%M:%S"))
         else:
-            s2 = s.astype("string").fillna("")
-        vals = pd.unique(s2)
-        vals = [v for v in vals if v not in ("", "<NA>", "nan", "NaN")]
-        return sorted(vals)
+            # raw values, stringified once per distinct value rather than per row
+            vals = {str(v) for v in pd.unique(s)}
+        return sorted(v for v in vals if v not in ("", "<NA>", "nan", "NaN"))
 
     def _on_col_typed(self, col: str, var: tk.StringVar, widget: ttk.Combobox):
         txt = (var.get() or "").strip()
@@ -186,25 +222,25 @@ class UnderlyingsView(ttk.Frame):
 
         if not txt or txt == "All":
             widget["values"] = ["All"] + base[:self.SUGGESTIONS_MAX]
-            self.model.set_col_filter(col, "All")
-            self._refresh()
+            self.model.set_col_filter(col, "All", apply=False)
+            self._request_refresh(self.REFRESH_DEBOUNCE_MS)
             return
 
         q = txt.lower()
         matches = [v for v in base if q in v.lower()]
         widget["values"] = ["All"] + matches[:self.SUGGESTIONS_MAX]
 
-        self.model.set_col_filter(col, txt)
-        self._refresh()
+        self.model.set_col_filter(col, txt, apply=False)
+        self._request_refresh(self.REFRESH_DEBOUNCE_MS)
 
     def _on_col_filter(self, col: str, selected: str):
-        self.model.set_col_filter(col, selected)
-        self._refresh()
+        self.model.set_col_filter(col, selected, apply=False)
+        self._request_refresh()
         self.on_log(f"Filter: {col} contains '{selected}'" if selected != "All" else f"Filter cleared: {col}")
 
     def _on_global_search(self, _evt=None):
-        self.model.set_global_search(self.search_var.get())
-        self._refresh()
+        self.model.set_global_search(self.search_var.get(), apply=False)
+        self._request_refresh(self.REFRESH_DEBOUNCE_MS)
 
     def _clear_filters(self):
         self.model.clear_filters()
@@ -215,9 +251,27 @@ class UnderlyingsView(ttk.Frame):
         for col, cb in self._filter_widgets.items():
             base = self._uniques_cache.get(col, [])
             cb["values"] = ["All"] + base[:self.SUGGESTIONS_MAX]
-        self._refresh()
+        self._request_refresh()
         self.on_log("All filters cleared")
 
+    def _request_refresh(self, delay_ms: int = 0):
+        """Marks the view dirty; it is recomputed once when Tk is idle (or after delay_ms)."""
+        self._dirty = True
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+        if delay_ms:
+            self._refresh_job = self.after(delay_ms, self._maybe_refresh)
+        else:
+            self._refresh_job = self.after_idle(self._maybe_refresh)
+
+    def _maybe_refresh(self):
+        self._refresh_job = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        self.model.apply_filters()
+        self._refresh()
+
     def _refresh(self):
         if self.model.view is None:
             self.table.clear()
@@ -18,9 +18,14 @@ def main():
         under = win.get_underlyings_df()
         if under is None:
             return
-        df_raptor = make_fake_raptor_from_underlyings(under, n_rows=1_000_000, seed=123)
-        win.set_raptor_df(df_raptor)
-        win.show_raptor()
+
+        def on_loaded(df_raptor):
+            win.set_raptor_df(df_raptor)
+            win.show_raptor()
+
+        # generated on a worker thread; the window stays responsive and gets the frame on the Tk thread
+        win.run_in_background("Generating Raptor", make_fake_raptor_from_underlyings, under, 1_000_000, 123,
+                              on_done=on_loaded, button=win.load_raptor_btn)
 
     win.load_under_btn.configure(command=load_underlying)
     win.load_raptor_btn.configure(command=load_raptor)
@@ -10,21 +10,83 @@ def _require_df(df: pd.DataFrame | None, name: str):
         raise ValueError(f"{name} dataframe is empty. Load it first.")
 
 
-def action_1(raptor: pd.DataFrame) -> pd.DataFrame:
+def _compact(out: pd.DataFrame, keys: list[str] | None = None) -> pd.DataFrame:
+    """Rounds float aggregates, downcasts ints and makes string keys categorical: smaller frames, shorter cells."""
+    new = {c: out[c].round(4) for c in out.select_dtypes(include="float").columns}
+    new.update({c: pd.to_numeric(out[c], downcast="integer") for c in out.select_dtypes(include="integer").columns})
+    new.update({c: out[c].astype("category") for c in keys or () if c in out.columns and out[c].dtype == object})
+    return out.assign(**new) if new else out
+
+
+# group keys shared by several actions; set_raptor_df prebuilds these once per frame
+GROUPER_KEYS = [("Issuer",), ("Issuer", "Type", "OptionType"), ("Issuer", "currency")]
+
+
+def build_groupers(raptor: pd.DataFrame) -> dict[tuple[str, ...], object]:
+    """
+    GroupBy objects for GROUPER_KEYS (those whose columns exist), with their group codes
+    already computed so actions running on worker threads only read them.
+    """
+    out = {}
+    for keys in GROUPER_KEYS:
+        if all(k in raptor.columns for k in keys):
+            g = raptor.groupby(list(keys), observed=True)
+            g.ngroups  # factorize the keys now
+            out[keys] = g
+    return out
+
+
+def _groupby(raptor: pd.DataFrame, keys: list[str], groupers: dict | None):
+    g = (groupers or {}).get(tuple(keys))
+    return g if g is not None else raptor.groupby(keys, observed=True)
+
+
+def _float32_to_64(s: pd.Series) -> pd.Series:
+    """
+    float32 -> float64 rounded to float32's 7 significant digits: the decimal that was stored
+    comes back (126.6, not 126.59999847), so sums over many rows don't drift.
+    """
+    x = s.to_numpy(dtype="float64", na_value=np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mag = np.floor(np.log10(np.abs(x)))
+    scale = 10.0 ** (6 - np.where(np.isfinite(mag), mag, 0))
+    return pd.Series(np.round(x * scale) / scale, index=s.index, name=s.name)
+
+
+def _widen_float32(df: pd.DataFrame) -> pd.DataFrame:
+    """float32 columns -> float64. The raptor is stored downcast, and sums/means keep the values' dtype."""
+    wide = {c: _float32_to_64(df[c]) for c in df.columns if df[c].dtype == np.float32}
+    return df.assign(**wide) if wide else df
+
+
+def _value_groupby(raptor: pd.DataFrame, by: list, use: list[str], groupers: dict | None = None):
+    """
+    GroupBy over raptor[use] by column names and/or key Series. float32 value columns are
+    aggregated as float64; the prebuilt grouper is only usable when nothing needs widening.
+    """
+    if not any(raptor[c].dtype == np.float32 for c in use):
+        if all(isinstance(k, str) for k in by):
+            return _groupby(raptor, by, groupers)[use]
+        return raptor.groupby(by, observed=True)[use]
+    keys = [raptor[k] if isinstance(k, str) else k for k in by]
+    return _widen_float32(raptor[use]).groupby(keys, observed=True)
+
+
+def action_1(raptor: pd.DataFrame, groupers: dict | None = None) -> pd.DataFrame:
     _require_df(raptor, "Raptor")
     cols = [c for c in ["Issuer", "Type", "OptionType"] if c in raptor.columns]
     if not cols:
-        numeric = raptor.select_dtypes(include="number")
+        numeric = _widen_float32(raptor.select_dtypes(include="number"))
         return numeric.describe().T.reset_index().rename(columns={"index": "metric"})
 
     numeric_cols = raptor.select_dtypes(include="number").columns.tolist()
     use = [c for c in ["volume_1d", "open_interest", "spread_bps", "iv_30d", "px_last"] if c in numeric_cols] or numeric_cols[:6]
-    agg = raptor.groupby(cols, observed=True)[use].agg(["count", "mean", "sum"])
+    agg = _value_groupby(raptor, cols, use, groupers).agg(["count", "mean", "sum"])
     agg.columns = ["_".join([a, b]) for a, b in agg.columns.to_flat_index()]
-    return agg.reset_index()
+    return _compact(agg.reset_index(), cols)
 
 
-def action_2(raptor: pd.DataFrame) -> pd.DataFrame:
+def action_2(raptor: pd.DataFrame, groupers: dict | None = None) -> pd.DataFrame:
     _require_df(raptor, "Raptor")
     sort_col = "open_interest" if "open_interest" in raptor.columns else None
     if sort_col is None:
@@ -33,7 +95,8 @@ def action_2(raptor: pd.DataFrame) -> pd.DataFrame:
     if sort_col is None:
         return raptor.head(200).reset_index(drop=True)
 
-    out = raptor.sort_values(by=sort_col, ascending=False, na_position="last").head(1000).copy()
+    # partial selection (heap of k) instead of sorting every row; NaNs are never among the largest
+    out = raptor.nlargest(1000, sort_col)
     preferred = [c for c in ["scheme_id", "underlying_isin", "Issuer", "Type", "OptionType", "currency", "Maturity",
                              "strike", "leverage", "Bid", "Ask", "px_last", "open_interest", "volume_1d", "spread_bps", "iv_30d"]
                  if c in out.columns]
@@ -42,65 +105,90 @@ def action_2(raptor: pd.DataFrame) -> pd.DataFrame:
     return out.reset_index(drop=True)
 
 
-def action_3(raptor: pd.DataFrame) -> pd.DataFrame:
+def action_3(raptor: pd.DataFrame, groupers: dict | None = None) -> pd.DataFrame:
     _require_df(raptor, "Raptor")
     df = raptor
     rows = len(df)
-    miss = df.isna().mean().rename("missing_frac").reset_index().rename(columns={"index": "column"})
-    miss["missing_pct"] = (miss["missing_frac"] * 100).round(2)
-    miss = miss.sort_values("missing_frac", ascending=False)
-    dtypes = df.dtypes.astype(str).rename("dtype").reset_index().rename(columns={"index": "column"})
-    out = miss.merge(dtypes, on="column", how="left")
-    out.insert(0, "rows_total", rows)
-    return out[["rows_total", "column", "dtype", "missing_pct", "missing_frac"]]
-
-
-def action_4(raptor: pd.DataFrame) -> pd.DataFrame:
+    # one pass per column for both dtype and missing count: no full boolean frame, no merge.
+    # plain numpy int/uint/bool columns can't hold NA, so they aren't scanned at all
+    missing = np.array([0 if isinstance(s.dtype, np.dtype) and s.dtype.kind in "iub" else int(s.isna().sum())
+                        for _, s in df.items()])
+    missing_frac = missing / rows
+    out = pd.DataFrame({
+        "rows_total": rows,
+        "column": df.columns.to_numpy(),
+        "dtype": df.dtypes.astype(str).to_numpy(),
+        "missing_pct": (missing_frac * 100).round(2),
+        "missing_frac": missing_frac,
+    })
+    return out.sort_values("missing_frac", ascending=False, kind="stable", ignore_index=True)
+
+
+def action_4(raptor: pd.DataFrame, groupers: dict | None = None) -> pd.DataFrame:
     _require_df(raptor, "Raptor")
     if "Issuer" not in raptor.columns or "currency" not in raptor.columns:
-        return action_1(raptor)
-    g = raptor.groupby(["Issuer", "currency"], observed=True)
+        return action_1(raptor, groupers)
+    gb = _groupby(raptor, ["Issuer", "currency"], groupers)
     if "spread_bps" in raptor.columns:
-        out = g["spread_bps"].agg(count="count", mean="mean", p95=lambda s: float(np.nanpercentile(pd.to_numeric(s, errors="coerce"), 95)))
+        # compiled count/mean/quantile over all groups (no per-group Python call);
+        # non-numeric spreads are coerced once up front, float32 ones widened (mean/p95 keep the dtype)
+        sb = raptor["spread_bps"]
+        if pd.api.types.is_numeric_dtype(sb) and sb.dtype != np.float32:
+            g = gb["spread_bps"]
+        else:
+            sb = _float32_to_64(sb) if sb.dtype == np.float32 else pd.to_numeric(sb, errors="coerce")
+            g = sb.groupby([raptor["Issuer"], raptor["currency"]], observed=True)
+        out = g.agg(["count", "mean"])
+        out["p95"] = g.quantile(0.95)  # same group index as out: plain column assignment, no join
     else:
-        out = g.size().to_frame("count")
-    return out.reset_index()
+        out = gb.size().to_frame("count")
+    return _compact(out.reset_index(), ["Issuer", "currency"])
 
 
-def action_5(raptor: pd.DataFrame) -> pd.DataFrame:
+def action_5(raptor: pd.DataFrame, groupers: dict | None = None) -> pd.DataFrame:
     _require_df(raptor, "Raptor")
     if "Maturity" not in raptor.columns:
-        return action_1(raptor)
+        return action_1(raptor, groupers)
+    now = pd.Timestamp.now()
     m = pd.to_datetime(raptor["Maturity"], errors="coerce")
-    days = (m - pd.Timestamp.now()).dt.days
-    buckets = pd.cut(days, bins=[-10_000, 0, 7, 30, 90, 180, 365, 10_000], labels=["expired", "0-7d", "7-30d", "1-3m", "3-6m", "6-12m", "1y+"])
-    df = raptor.copy()
-    df["mat_bucket"] = buckets.astype("string")
-    gcols = [c for c in ["Issuer", "mat_bucket"] if c in df.columns] or ["mat_bucket"]
-    use = [c for c in ["open_interest", "volume_1d", "spread_bps"] if c in df.columns] or df.select_dtypes(include="number").columns.tolist()[:3]
-    out = df.groupby(gcols, observed=True)[use].agg(["count", "mean"])
+    days = (m - now).dt.days.to_numpy(dtype="float64", na_value=np.nan)
+    bins = np.array([-10_000, 0, 7, 30, 90, 180, 365, 10_000])
+    labels = ["expired", "0-7d", "7-30d", "1-3m", "3-6m", "6-12m", "1y+"]
+    # same right-closed bins as pd.cut: side="left" puts an edge value in the bucket it closes.
+    # NaN sorts past the last edge, so it lands out of range with everything else -> code -1
+    codes = np.searchsorted(bins, days, side="left") - 1
+    codes[(codes < 0) | (codes >= len(labels))] = -1
+    buckets = pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+    gcols = [c for c in ["Issuer"] if c in raptor.columns]
+    use = [c for c in ["open_interest", "volume_1d", "spread_bps"] if c in raptor.columns] or raptor.select_dtypes(include="number").columns.tolist()[:3]
+    # group the frame itself by key Series (bucket kept categorical): no subset frame, no copy
+    keys = [raptor[c] for c in gcols] + [pd.Series(buckets, index=raptor.index, name="mat_bucket")]
+    out = _value_groupby(raptor, keys, use).agg(["count", "mean"])
     out.columns = ["_".join([a, b]) for a, b in out.columns.to_flat_index()]
-    return out.reset_index()
+    return _compact(out.reset_index(), gcols)
 
 
-def action_issuer_plot_table(raptor: pd.DataFrame) -> pd.DataFrame:
+def action_issuer_plot_table(raptor: pd.DataFrame, groupers: dict | None = None) -> pd.DataFrame:
     _require_df(raptor, "Raptor")
     if "Issuer" not in raptor.columns:
         return pd.DataFrame({"info": ["Missing issuer column"]})
-    out = raptor.groupby("Issuer", observed=True).agg(
-        count=("Issuer", "size"),
-        avg_spread_bps=("spread_bps", "mean") if "spread_bps" in raptor.columns else ("Issuer", "size"),
-        avg_strike=("strike", "mean") if "strike" in raptor.columns else ("Issuer", "size"),
-    ).reset_index()
-    return out
+    vals = [c for c in ["spread_bps", "strike"] if c in raptor.columns]
+    out = _groupby(raptor, ["Issuer"], groupers).size().to_frame("count")
+    means = _value_groupby(raptor, ["Issuer"], vals, groupers).mean() if vals else None
+    out["avg_spread_bps"] = means["spread_bps"] if "spread_bps" in vals else out["count"]
+    out["avg_strike"] = means["strike"] if "strike" in vals else out["count"]
+    return _compact(out.reset_index(), ["Issuer"])
 
 
-def action_7(raptor: pd.DataFrame) -> pd.DataFrame:
+def action_7(raptor: pd.DataFrame, groupers: dict | None = None) -> pd.DataFrame:
     _require_df(raptor, "Raptor")
     if "delta" not in raptor.columns:
-        return action_2(raptor)
-    out = raptor.assign(abs_delta=pd.to_numeric(raptor["delta"], errors="coerce").abs())
-    out = out.sort_values("abs_delta", ascending=False, na_position="last").head(800)
+        return action_2(raptor, groupers)
+    # select on the abs_delta Series alone (positional index, delta's own dtype), then take
+    # just those rows: no full-frame assign()
+    abs_delta = pd.to_numeric(raptor["delta"], errors="coerce").abs().reset_index(drop=True)
+    top = abs_delta.nlargest(800).index.to_numpy()
+    out = raptor.take(top).assign(abs_delta=abs_delta.iloc[top].array)
     cols = [c for c in ["scheme_id", "Issuer", "Type", "OptionType", "Bid", "Ask", "delta", "abs_delta", "iv_30d"] if c in out.columns]
     if cols:
         out = out[cols]
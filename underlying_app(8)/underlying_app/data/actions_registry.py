@@ -1,22 +1,45 @@
 
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass
 from typing import Callable, Optional, Any
 
-import pandas as pd
+
+def _takes_groupers(fn: Callable[..., Any]) -> bool:
+    """True if fn accepts a second positional argument (the groupers dict)."""
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):  # builtins without a signature: assume the current contract
+        return True
+    if any(p.kind is p.VAR_POSITIONAL for p in params):
+        return True
+    return sum(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in params) >= 2
 
 
 @dataclass(frozen=True)
 class ActionSpec:
+    """
+    One toolbar action and the view showing its result.
+
+    run is called as run(raptor, groupers), groupers being the shared GroupBy objects from
+    build_groupers (may be None). Actions written for the original run(raptor) contract
+    keep working: call() passes groupers only when run accepts a second argument.
+    """
     key: str
     name: str
     button_text: str
     view_title: str
-    run: Callable[[pd.DataFrame], Any]
+    run: Callable[..., Any]      # run(raptor, groupers) or run(raptor) -> result; see call()
     view_type: str = "table"     # "table", "spread_matrix", "table_plot"
     enable_filters: bool = False
     row_limit: Optional[int] = 2000
+    lazy: bool = True            # computed when its view is first shown, not when queued
+
+    def call(self, raptor, groupers: dict | None = None) -> Any:
+        if _takes_groupers(self.run):
+            return self.run(raptor, groupers)
+        return self.run(raptor)
 
 
 def get_default_actions() -> list[ActionSpec]:
@@ -28,6 +51,6 @@ def get_default_actions() -> list[ActionSpec]:
         ActionSpec("action3", "Acción 3", "Calculate 3", "Acción 3", action_3, "table"),
         ActionSpec("action4", "Acción 4", "Calculate 4", "Acción 4", action_4, "table"),
         ActionSpec("action5", "Acción 5", "Calculate 5", "Acción 5", action_5, "table"),
-        ActionSpec("action6", "Spread Matrix", "Matrix", "Spread Matrix", lambda df: df, "spread_matrix"),
+        ActionSpec("action6", "Spread Matrix", "Matrix", "Spread Matrix", lambda df, groupers=None: df, "spread_matrix"),
         ActionSpec("action7", "Issuer Plot", "Plot", "Issuer Plot", action_issuer_plot_table, "table_plot"),
     ]
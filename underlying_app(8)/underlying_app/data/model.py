@@ -1,15 +1,21 @@
 
 from __future__ import annotations
 
+from importlib.util import find_spec
+
 import pandas as pd
 
+# Arrow-backed strings (contiguous UTF-8, C hash/contains kernels) when pyarrow is available
+TEXT_DTYPE = "string[pyarrow]" if find_spec("pyarrow") is not None else "string"
+
 
 class DataModel:
     """
     General-purpose model:
       - df: original dataframe
       - view: filtered dataframe
-      - col_filters: per-column text filters (string/obj/cat/datetime only). Empty or "All" disables.
+      - col_filters: active per-column text filters (string/obj/cat/datetime only).
+        Setting "All" or empty removes the column's entry, so only selective filters are stored.
       - global_search: substring search across all non-numeric columns
     """
     def __init__(self):
@@ -20,25 +26,30 @@ class DataModel:
 
     def set_df(self, df: pd.DataFrame):
         self.df = df
-        self.col_filters = {c: "All" for c in df.columns}
+        self.col_filters = {}
         self.global_search = ""
         self.apply_filters()
 
-    def set_col_filter(self, column: str, text: str):
+    def set_col_filter(self, column: str, text: str, apply: bool = True):
+        """apply=False lets callers batch several filter edits into one apply_filters()."""
         if self.df is None or column not in self.df.columns:
             return
-        self.col_filters[column] = text if text else "All"
-        self.apply_filters()
-
-    def set_global_search(self, text: str):
+        if text in ("", "All"):
+            self.col_filters.pop(column, None)
+        else:
+            self.col_filters[column] = text
+        if apply:
+            self.apply_filters()
+
+    def set_global_search(self, text: str, apply: bool = True):
         self.global_search = (text or "").strip()
-        self.apply_filters()
+        if apply:
+            self.apply_filters()
 
     def clear_filters(self):
         if self.df is None:
             return
-        for c in self.df.columns:
-            self.col_filters[c] = "All"
+        self.col_filters.clear()
         self.global_search = ""
         self.apply_filters()
 
@@ -48,11 +59,13 @@ class DataModel:
             return
 
         df = self.df
+        if not self.col_filters and not self.global_search:
+            # nothing selective: the view is the frame itself
+            self.view = df
+            return
 
         # Per-column filters (contains match, case-insensitive) for non-numeric columns only
         for col, filt in self.col_filters.items():
-            if filt in ("", "All"):
-                continue
             s = df[col]
 
             # No filters for numeric columns
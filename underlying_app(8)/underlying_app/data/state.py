@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
 
 @dataclass
@@ -13,10 +13,14 @@ class PipelineState:
       - whether datasets are loaded
       - when datasets/actions were computed
       - stale detection (e.g. action computed on old raptor)
+      - pending actions (queued, computed when their view is shown)
+      - failed actions (last run raised; rerun only from their Run button)
     """
     underlyings_loaded_at: Optional[datetime] = None
     raptor_loaded_at: Optional[datetime] = None
     actions_computed_at: Dict[str, datetime] = field(default_factory=dict)
+    actions_pending: Set[str] = field(default_factory=set)
+    actions_failed: Set[str] = field(default_factory=set)
 
     def is_underlyings_loaded(self) -> bool:
         return self.underlyings_loaded_at is not None
@@ -32,6 +36,23 @@ class PipelineState:
 
     def mark_action_computed(self, action_key: str):
         self.actions_computed_at[action_key] = datetime.now()
+        self.actions_pending.discard(action_key)
+        self.actions_failed.discard(action_key)
+
+    def mark_action_pending(self, action_key: str):
+        self.actions_pending.add(action_key)
+        self.actions_failed.discard(action_key)
+
+    def mark_action_failed(self, action_key: str):
+        # no longer pending: showing its view must not resubmit it
+        self.actions_pending.discard(action_key)
+        self.actions_failed.add(action_key)
+
+    def is_action_failed(self, action_key: str) -> bool:
+        return action_key in self.actions_failed
+
+    def is_action_pending(self, action_key: str) -> bool:
+        return action_key in self.actions_pending
 
     def is_action_ready(self, action_key: str) -> bool:
         return action_key in self.actions_computed_at
@@ -1,13 +1,40 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date
 
+import numpy as np
 import pandas as pd
 import tkinter as tk
 from tkinter import ttk
 
 
+DATETIME_FMT = "%Y-%m-%d %H:%M:%S"
+DATETIME_LEN = 19  # len() of any DATETIME_FMT output
+
+
+def _format_column(s: pd.Series) -> pd.Series:
+    # whole-column formatting: datetimes in the table's fixed format, everything else via str; NA -> ""
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s.dt.strftime(DATETIME_FMT).fillna("")
+    return s.astype("string").fillna("")
+
+
+def _tcl_quote_column(s: pd.Series) -> pd.Series:
+    # double-quoted Tcl words: escape what is special inside quotes (\\ " [ $), whole column at once
+    q = (s.str.replace("\\", "\\\\", regex=False).str.replace('"', '\\"', regex=False)
+          .str.replace("[", "\\[", regex=False).str.replace("$", "\\$", regex=False))
+    return '"' + q + '"'
+
+
+def _today_mask(df: pd.DataFrame) -> np.ndarray:
+    """Rows whose EventNext falls on today's date (all False without that column)."""
+    if "EventNext" not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    ev = pd.to_datetime(df["EventNext"], errors="coerce")
+    return (ev.dt.normalize() == pd.Timestamp(date.today(), tz=ev.dt.tz)).to_numpy()
+
+
 class DataTable(ttk.Frame):
     BIG_DF_ROW_THRESHOLD = 20000
     SAMPLE_FOR_WIDTH = 5000
@@ -15,15 +42,18 @@ class DataTable(ttk.Frame):
     PADDING_PX = 24
     MIN_PX = 80
     MAX_PX = 1200
+    VIRTUAL_ROW_THRESHOLD = 1000
+    ROW_PX = 24
+    INSERT_BATCH = 500
 
     def __init__(self, parent: tk.Misc, on_copy=None):
         super().__init__(parent, style="Panel.TFrame")
         self.on_copy = on_copy
 
         self.tree = ttk.Treeview(self, columns=(), show="headings", selectmode="extended")
-        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self._on_vscroll)
         self.hsb = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=self.vsb.set, xscrollcommand=self.hsb.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=self.hsb.set)
 
         self.tree.grid(row=0, column=0, sticky="nsew")
         self.vsb.grid(row=0, column=1, sticky="ns")
@@ -35,18 +65,57 @@ class DataTable(ttk.Frame):
         self.tree.tag_configure("event_today", background="#fff7d6")
 
         self._df: pd.DataFrame | None = None
+        self._base_df: pd.DataFrame | None = None  # frame as given; sorts reorder from it
+        # virtual mode sort: display order as positions in _base_df (None = _df's own order)
+        self._order: np.ndarray | None = None
+        # EventNext-is-today flags: per _base_df row (computed once per frame) and in display order
+        self._today_base: np.ndarray = np.zeros(0, dtype=bool)
+        self._today: np.ndarray = self._today_base
+        # col -> (ascending row positions in _base_df, count of non-NA keys)
+        self._sort_key_cache: dict[str, tuple[np.ndarray, int]] = {}
+        self._content_len: dict[str, int] = {}  # longest formatted cell per column (chars)
+        self._col_px: dict[str, int] = {}  # width last applied per column
+        self._anchors: dict[str, str] = {}  # column -> anchor, from its dtype
+        self._cols_cache: tuple[str, ...] = ()  # tree columns, kept Python-side for click lookups
         self._sort_col: str | None = None
+        self._prev_sort_col: str | None = None  # column whose heading shows an indicator now
         self._sort_asc: bool = True
         self._last_cell_value: str | None = None
 
+        # virtual mode: only rows [_first_row, _first_row + page) of _df exist as items;
+        # _window is the inserted range, each row's item id is "r<position in _df>"
+        self._virtual = False
+        self._first_row = 0
+        self._window = (0, 0)
+        try:
+            self._row_px = int(ttk.Style(self).lookup("Treeview", "rowheight") or self.ROW_PX)
+        except (tk.TclError, ValueError):
+            self._row_px = self.ROW_PX
+
+        self.tree.bind("<Configure>", lambda _e: self._render_window(), add=True)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_wheel, add=True)
         self.tree.bind("<Button-1>", self._on_single_click, add=True)
         self.tree.bind("<Double-1>", self._on_double_click, add=True)
         self.tree.bind("<Control-c>", self._on_ctrl_c, add=True)
         self.tree.bind("<Control-C>", self._on_ctrl_c, add=True)
 
     def set_dataframe(self, df: pd.DataFrame):
-        self._df = df.copy()
+        """
+        Shows df without copying it. The table treats df as read-only: sorting builds a
+        reordered frame with take(), and formatting works on derived Series. Callers that
+        later modify df in place should pass a copy (or call set_dataframe again).
+        """
+        self._df = df
+        self._base_df = df
+        self._order = None
+        self._today_base = self._today = _today_mask(df)
+        self._sort_key_cache.clear()
+        self._content_len.clear()
+        self._col_px.clear()
+        self._anchors = {c: self._col_anchor_for_dtype(df[c]) for c in df.columns}
         self._sort_col = None
+        self._prev_sort_col = None
         self._sort_asc = True
         self._last_cell_value = None
         self._rebuild_columns(self._df)
@@ -54,11 +123,19 @@ class DataTable(ttk.Frame):
         self.autofit_columns()
 
     def clear(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._clear_rows()
         self.tree["columns"] = ()
+        self._cols_cache = ()
         self._df = None
+        self._base_df = None
+        self._order = None
+        self._today_base = self._today = np.zeros(0, dtype=bool)
+        self._sort_key_cache.clear()
+        self._content_len.clear()
+        self._col_px.clear()
+        self._anchors.clear()
         self._sort_col = None
+        self._prev_sort_col = None
         self._sort_asc = True
         self._last_cell_value = None
 
@@ -69,21 +146,6 @@ class DataTable(ttk.Frame):
             return "center"
         return "w"
 
-    def _format_value(self, v):
-        if v is None:
-            return ""
-        try:
-            if pd.isna(v):
-                return ""
-        except Exception:
-            pass
-        if isinstance(v, (pd.Timestamp, datetime)):
-            try:
-                return pd.to_datetime(v).strftime("%Y-%m-%d %H:%M:%S")
-            except Exception:
-                return str(v)
-        return str(v)
-
     def _heading_text(self, col: str) -> str:
         if self._sort_col != col:
             return col
@@ -92,16 +154,18 @@ class DataTable(ttk.Frame):
     def _rebuild_columns(self, df: pd.DataFrame):
         cols = list(df.columns)
         self.tree["columns"] = cols
+        self._cols_cache = tuple(cols)
         for c in cols:
             self.tree.heading(c, text=self._heading_text(c), command=lambda col=c: self._on_heading_click(col))
-            anchor = self._col_anchor_for_dtype(df[c])
-            self.tree.column(c, width=120, anchor=anchor, stretch=False)
+            self.tree.column(c, width=120, anchor=self._anchors.get(c, "w"), stretch=False)
 
     def _update_all_headings(self):
         if self._df is None:
             return
-        for c in self._df.columns:
+        # only the old and the new sort column change their indicator
+        for c in {self._prev_sort_col, self._sort_col} - {None}:
             self.tree.heading(c, text=self._heading_text(c))
+        self._prev_sort_col = self._sort_col
 
     def _on_heading_click(self, col: str):
         if self._df is None or col not in self._df.columns:
@@ -113,76 +177,201 @@ class DataTable(ttk.Frame):
             self._sort_col = col
             self._sort_asc = True
 
-        s = self._df[col]
         asc = self._sort_asc
 
         try:
-            if pd.api.types.is_datetime64_any_dtype(s):
-                key = pd.to_datetime(s, errors="coerce")
-            elif pd.api.types.is_numeric_dtype(s):
-                key = pd.to_numeric(s, errors="coerce")
+            order, n_valid = self._sort_order(col)
+            if not asc:
+                # descending = ascending reversed, NAs still last
+                order = np.concatenate([order[:n_valid][::-1], order[n_valid:]])
+            self._today = self._today_base[order]
+            if len(order) > self.VIRTUAL_ROW_THRESHOLD:
+                # virtual mode gathers each viewport through the order; never reorder the whole frame
+                self._df, self._order = self._base_df, order
             else:
-                key = s.astype("string").fillna("").str.lower()
-
-            order = key.sort_values(ascending=asc, na_position="last").index
-            self._df = self._df.loc[order]
+                self._df, self._order = self._base_df.take(order), None
         except Exception:
-            self._df = self._df.sort_values(by=col, ascending=asc, kind="mergesort")
+            self._df = self._base_df.sort_values(by=col, ascending=asc, kind="mergesort")
+            self._order = None
+            self._today = _today_mask(self._df)
 
         self._update_all_headings()
         self._populate_rows(self._df)
         self.autofit_columns()
 
+    def _sort_order(self, col: str) -> tuple[np.ndarray, int]:
+        """Ascending order of _base_df by col, coerced and sorted once per column."""
+        hit = self._sort_key_cache.get(col)
+        if hit is not None:
+            return hit
+        s = self._base_df[col]
+        if pd.api.types.is_datetime64_any_dtype(s):
+            key = pd.to_datetime(s, errors="coerce")
+        elif pd.api.types.is_numeric_dtype(s):
+            key = pd.to_numeric(s, errors="coerce")
+        else:
+            key = s.astype("string").fillna("").str.lower()
+        key = key.reset_index(drop=True)
+        order = key.sort_values(ascending=True, na_position="last", kind="stable").index.to_numpy()
+        hit = self._sort_key_cache[col] = (order, int(key.notna().sum()))
+        return hit
+
+    def _delete_all_items(self):
+        # resolved and deleted Tcl-side: item ids never round-trip through Python
+        tree = str(self.tree)
+        self.tk.eval(f"{tree} delete [{tree} children {{}}]")
+
+    def _clear_rows(self):
+        self._delete_all_items()
+        self._virtual = False
+        self._first_row = 0
+        self._window = (0, 0)
+
     def _populate_rows(self, df: pd.DataFrame):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._clear_rows()
 
         if df is None or df.empty:
             return
 
-        today = date.today()
-        has_eventnext = "EventNext" in df.columns
+        if len(df) > self.VIRTUAL_ROW_THRESHOLD:
+            # large frames: keep them in memory, materialize only the viewport
+            self._virtual = True
+            self._render_window()
+            return
 
-        for _, row in df.iterrows():
-            values = [self._format_value(row[c]) for c in df.columns]
-            tags = ()
-            if has_eventnext:
-                try:
-                    ev = pd.to_datetime(row["EventNext"], errors="coerce")
-                    if pd.notna(ev) and ev.date() == today:
-                        tags = ("event_today",)
-                except Exception:
-                    pass
-            self.tree.insert("", "end", values=values, tags=tags)
+        self._insert_rows(df, first_row=0)
+
+    def _insert_rows(self, df: pd.DataFrame, index: int | None = None, first_row: int | None = None):
+        """
+        index: tree position of the first row (None appends).
+        first_row: _df position of the first row; gives items the id "r<position>"
+            (None lets Tk assign ids).
+        """
+        # format and quote column-wise, then one Tcl eval per INSERT_BATCH rows
+        # instead of one tree.insert() round trip per row
+        quoted = [_tcl_quote_column(_format_column(df[c])) for c in df.columns]
+        if not quoted:
+            return
+        # each row's value words joined column-wise too: the loop below sees one str per row
+        words = quoted[0].str.cat([q.to_numpy() for q in quoted[1:]], sep=" ").tolist()
+        if first_row is None:
+            today_mask = _today_mask(df).tolist()
+        else:
+            today_mask = self._today[first_row:first_row + len(df)].tolist()
+        tree = str(self.tree)
+        lines = []
+
+        for k, (vals, is_today) in enumerate(zip(words, today_mask)):
+            where = "end" if index is None else index + k
+            iid = "" if first_row is None else f" -id r{first_row + k}"
+            tags = " -tags event_today" if is_today else ""
+            lines.append(f"{tree} insert {{}} {where}{iid} -values [list {vals}]{tags}")
+            if len(lines) >= self.INSERT_BATCH:
+                self.tk.eval("\n".join(lines))
+                lines.clear()
+        if lines:
+            self.tk.eval("\n".join(lines))
+
+    # --- Virtual scrolling ---
+    def _rows(self, start: int, end: int) -> pd.DataFrame:
+        """Rows [start, end) in display order."""
+        if self._order is None:
+            return self._df.iloc[start:end]
+        return self._base_df.take(self._order[start:end])
+
+    def _visible_rows(self) -> int:
+        height = self.tree.winfo_height()
+        if height <= 1:
+            # not mapped yet; <Configure> re-renders with the real size
+            return 50
+        return max(1, height // self._row_px)
+
+    def _render_window(self):
+        if not self._virtual or self._df is None:
+            return
+        n = len(self._df)
+        page = self._visible_rows()
+        start = max(0, min(self._first_row, n - page))
+        end = min(n, start + page)
+        self._first_row = start
+
+        # keep the rows still in view; delete the ones that left, insert the ones that entered
+        old_start, old_end = self._window
+        keep_start, keep_end = max(start, old_start), min(end, old_end)
+        if keep_start >= keep_end:
+            self._delete_all_items()
+            self._insert_rows(self._rows(start, end), first_row=start)
+        else:
+            stale = [f"r{i}" for i in (*range(old_start, keep_start), *range(keep_end, old_end))]
+            if stale:
+                self.tree.delete(*stale)
+            if start < keep_start:
+                self._insert_rows(self._rows(start, keep_start), index=0, first_row=start)
+            if keep_end < end:
+                self._insert_rows(self._rows(keep_end, end), first_row=keep_end)
+        self._window = (start, end)
+        self.vsb.set(start / n, end / n)
+
+    def _on_vscroll(self, *args):
+        if not self._virtual:
+            self.tree.yview(*args)
+            return
+        if args[0] == "moveto":
+            self._first_row = int(float(args[1]) * len(self._df))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self._first_row += step * self._visible_rows() if args[2] == "pages" else step
+        self._render_window()
+
+    def _on_tree_yscroll(self, first, last):
+        # in virtual mode the scrollbar tracks the window over _df, not the tree's items
+        if not self._virtual:
+            self.vsb.set(first, last)
+
+    def _on_wheel(self, event):
+        if not self._virtual:
+            return None
+        up = event.num == 4 or event.delta > 0
+        self._first_row += -3 if up else 3
+        self._render_window()
+        return "break"
 
     def autofit_columns(self):
         df = self._df
         if df is None or df.empty:
             return
 
-        if len(df) > self.BIG_DF_ROW_THRESHOLD:
-            sample = df.sample(n=min(self.SAMPLE_FOR_WIDTH, len(df)), random_state=0)
-        else:
-            sample = df
+        if not self._content_len:
+            # content widths don't change on sort: measure the frame as given, once
+            base = self._base_df
+            if len(base) > self.BIG_DF_ROW_THRESHOLD:
+                # leading rows: a contiguous slice, no random gather over the whole frame
+                sample = base.head(self.SAMPLE_FOR_WIDTH)
+            else:
+                sample = base
+            for c in base.columns:
+                col = sample[c]
+                if pd.api.types.is_datetime64_any_dtype(col):
+                    # fixed-width format: no need to strftime the column just to measure it
+                    self._content_len[c] = DATETIME_LEN if col.notna().any() else 0
+                    continue
+                try:
+                    # same formatter as the rows, so widths match what is displayed
+                    m = _format_column(col).str.len().max()
+                    self._content_len[c] = int(m) if pd.notna(m) else 0
+                except Exception:
+                    self._content_len[c] = 0
 
+        # after a sort only the sort indicators change heading lengths: reconfigure
+        # just the columns whose width moved (anchors are set in _rebuild_columns)
         for c in df.columns:
-            header_len = len(self._heading_text(c))
-            max_len = header_len
-            try:
-                if pd.api.types.is_datetime64_any_dtype(sample[c]):
-                    s_str = pd.to_datetime(sample[c], errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S").fillna("")
-                else:
-                    s_str = sample[c].astype("string").fillna("")
-                m = s_str.map(len).max()
-                if pd.notna(m):
-                    max_len = max(max_len, int(m))
-            except Exception:
-                pass
+            max_len = max(len(self._heading_text(c)), self._content_len.get(c, 0))
 
             px = int(max_len * self.CHAR_PX + self.PADDING_PX)
             px = max(self.MIN_PX, min(self.MAX_PX, px))
-            anchor = self._col_anchor_for_dtype(df[c])
-            self.tree.column(c, width=px, anchor=anchor, stretch=False)
+            if self._col_px.get(c) != px:
+                self.tree.column(c, width=px)
+                self._col_px[c] = px
 
     # --- Copy support ---
     def _cell_at_event(self, event):
@@ -194,8 +383,7 @@ class DataTable(ttk.Frame):
             col_index = int(col_id.replace("#", "")) - 1
         except Exception:
             return None
-        cols = list(self.tree["columns"])
-        if col_index < 0 or col_index >= len(cols):
+        if col_index < 0 or col_index >= len(self._cols_cache):
             return None
         values = self.tree.item(row_id, "values")
         if not values:
@@ -4,6 +4,7 @@ from __future__ import annotations
 import tkinter as tk
 from tkinter import ttk
 
+import numpy as np
 import pandas as pd
 
 from ..data.model import DataModel
@@ -44,6 +45,9 @@ class DataView(ttk.Frame):
         self._pending_job: str | None = None
 
         self._uniques_cache: dict[str, list[str]] = {}
+        # per column: suggestions as an object array and their lowercase forms as a <U array
+        self._uniques_arr: dict[str, np.ndarray] = {}
+        self._uniques_lower: dict[str, np.ndarray] = {}
         self._filter_vars: dict[str, tk.StringVar] = {}
         self._filter_widgets: dict[str, ttk.Combobox] = {}
         self._search_buffer = ""
@@ -124,6 +128,8 @@ class DataView(ttk.Frame):
             w.destroy()
 
         self._uniques_cache.clear()
+        self._uniques_arr.clear()
+        self._uniques_lower.clear()
         self._filter_vars.clear()
         self._filter_widgets.clear()
 
@@ -181,11 +187,15 @@ class DataView(ttk.Frame):
 
             uniques = self._compute_uniques(s)
             self._uniques_cache[col] = uniques
+            self._uniques_arr[col] = np.array(uniques, dtype=object)
+            self._uniques_lower[col] = np.array([v.lower() for v in uniques], dtype=str)
             cb["values"] = ["All"] + uniques[:self.SUGGESTIONS_MAX]
             cb.grid(row=1, column=0, columnspan=2, sticky="w", pady=(2, 0))
 
             cb.bind("<<ComboboxSelected>>", lambda e, cc=col, vv=var: self._on_col_selected(cc, vv.get()))
             cb.bind("<KeyRelease>", lambda e, cc=col, vv=var, w=cb: self._on_col_typed(cc, vv, w))
+            # suggestions are only needed when the list drops down: compute them right then
+            cb.configure(postcommand=lambda cc=col, vv=var, w=cb: self._update_suggestions(cc, vv, w))
 
             self._filter_vars[col] = var
             self._filter_widgets[col] = cb
@@ -205,15 +215,23 @@ class DataView(ttk.Frame):
         return sorted(vals)
 
     def _on_col_typed(self, col: str, var: tk.StringVar, widget: ttk.Combobox):
+        # typing only re-filters; the suggestion list is rebuilt by postcommand when it opens
+        self._debounced_apply()
+
+    def _update_suggestions(self, col: str, var: tk.StringVar, widget: ttk.Combobox):
         txt = (var.get() or "").strip()
         base = self._uniques_cache.get(col, [])
         if not txt or txt == "All":
             widget["values"] = ["All"] + base[:self.SUGGESTIONS_MAX]
         else:
             q = txt.lower()
-            matches = [v for v in base if q in v.lower()]
-            widget["values"] = ["All"] + matches[:self.SUGGESTIONS_MAX]
-        self._debounced_apply()
+            lower = self._uniques_lower.get(col)
+            if lower is None or not len(lower):
+                matches = []
+            else:
+                mask = np.char.find(lower, q) >= 0
+                matches = self._uniques_arr[col][mask][:self.SUGGESTIONS_MAX].tolist()
+            widget["values"] = ["All"] + matches
 
     def _on_col_selected(self, col: str, selected: str):
         self.model.set_col_filter(col, selected)
@@ -230,9 +248,11 @@ class DataView(ttk.Frame):
 
     def _apply_filters_now(self):
         self._pending_job = None
+        # stage every edit, then filter once
         for col, var in self._filter_vars.items():
-            self.model.set_col_filter(col, var.get())
-        self.model.set_global_search(getattr(self, "search_var", tk.StringVar()).get())
+            self.model.set_col_filter(col, var.get(), apply=False)
+        self.model.set_global_search(getattr(self, "search_var", tk.StringVar()).get(), apply=False)
+        self.model.apply_filters()
         self._refresh()
 
     def _on_search_buffer(self, _evt=None):
@@ -2,18 +2,38 @@
 from __future__ import annotations
 
 import tkinter as tk
+from collections import deque
 from datetime import datetime
 
 
 class TextLogger:
+    FLUSH_MS = 50       # lines logged within this window go to the widget in one insert
+    MAX_PENDING = 10_000  # unflushed lines kept (oldest dropped first)
+    MAX_LINES = 5_000     # lines kept in the widget; older ones are trimmed on flush
+
     def __init__(self, text_widget: tk.Text):
         self.text = text_widget
         self.text.configure(state="disabled")
+        self._buf: deque[str] = deque(maxlen=self.MAX_PENDING)
+        self._flush_job: str | None = None
 
     def log(self, msg: str):
         ts = datetime.now().strftime("%H:%M:%S")
-        line = f"[{ts}] {msg}\n"
+        self._buf.append(f"[{ts}] {msg}\n")
+        if self._flush_job is None:
+            self._flush_job = self.text.after(self.FLUSH_MS, self._flush)
+
+    def _flush(self):
+        self._flush_job = None
+        if not self._buf:
+            return
+        lines = "".join(self._buf)
+        self._buf.clear()
         self.text.configure(state="normal")
-        self.text.insert("end", line)
+        self.text.insert("end", lines)
+        # every line ends in "\n", so "end-1c" sits on the empty line after the last one
+        excess = int(self.text.index("end-1c").split(".")[0]) - 1 - self.MAX_LINES
+        if excess > 0:
+            self.text.delete("1.0", f"{excess + 1}.0")
         self.text.see("end")
         self.text.configure(state="disabled")
@@ -2,14 +2,17 @@
 from __future__ import annotations
 
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk, messagebox
+from typing import Any, Callable
 
 import numpy as np
 import pandas as pd
 
 from ..theme import Theme
-from ..data.model import DataModel
+from ..data.model import DataModel, TEXT_DTYPE
 from ..data.state import PipelineState
+from ..data.actions import build_groupers
 from ..data.actions_registry import ActionSpec, get_default_actions
 from .logger import TextLogger
 from .styles import apply_futuristic_style
@@ -20,6 +23,10 @@ from .plot_canvas import PlotData
 
 
 class MainWindow(tk.Tk):
+    POLL_MS = 50  # how often to check for finished background actions
+    # raptor grouping keys: repeated strings, stored as categories so groupby hashes int codes
+    RAPTOR_CATEGORY_COLS = ("Issuer", "issuer", "Type", "OptionType", "product", "callput", "currency", "underlying_isin")
+
     def __init__(self, on_load_underlying, on_load_raptor, actions: list[ActionSpec] | None = None):
         super().__init__()
         self.title("Underlying App")
@@ -33,8 +40,25 @@ class MainWindow(tk.Tk):
         self._underlyings_df: pd.DataFrame | None = None
         self._raptor_df: pd.DataFrame | None = None
         self._action_dfs: dict[str, pd.DataFrame] = {}
+        # (action key, id(raptor), raptor version) -> output; the view holds the latest one.
+        # The version is bumped (and the cache dropped) on every set_raptor_df.
+        self._raptor_version = 0
+        self._raptor_groupers: dict = {}  # shared GroupBy objects for the current raptor
+        # issuer -> (strike, spread_bps, mean strike, mean spread); built on first plot per raptor version
+        self._issuer_xy: dict[str, tuple[np.ndarray, np.ndarray, float, float]] = {}
+        self._issuer_xy_version = -1
+        self._action_cache: dict[tuple[str, int, int], object] = {}
+
+        # action.call() executes on worker threads; results are picked up by _poll_actions
+        # on the Tk thread, so widgets are never touched from a worker
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="actions")
+        self._inflight: dict[str, tuple[Future, tuple[int, int]]] = {}
+        # run_in_background jobs: label -> (future, on_done, button disabled while it runs)
+        self._bg_jobs: dict[str, tuple[Future, Callable[[Any], None], ttk.Button | None]] = {}
+        self._poll_job: str | None = None
 
         self.actions: list[ActionSpec] = actions or get_default_actions()
+        self._actions_by_key = {a.key: a for a in self.actions}
 
         # Top bar
         self.top = ttk.Frame(self, style="Topbar.TFrame")
@@ -43,18 +67,18 @@ class MainWindow(tk.Tk):
         self.load_under_btn = ttk.Button(self.top, text="Load Underlying", style="Accent.TButton", command=on_load_underlying)
         self.load_under_btn.pack(side="left", padx=(12, 8), pady=10)
 
-        self.load_raptor_btn = ttk.Button(self.top, text="Load Raptor", style="Accent.TButton", command=on_load_raptor)
+        self.load_raptor_btn = ttk.Button(self.top, text="Load Raptor", style="Accent.TButton", command=on_load_raptor, state="disabled")
         self.load_raptor_btn.pack(side="left", padx=(0, 12), pady=10)
-        self.load_raptor_btn.state(["disabled"])
 
         ttk.Separator(self.top, orient="vertical").pack(side="left", fill="y", padx=10, pady=10)
 
-        self.action_buttons: dict[str, ttk.Button] = {}
-        for a in self.actions:
-            b = ttk.Button(self.top, text=a.button_text, command=lambda aa=a: self.run_action(aa))
-            b.pack(side="left", padx=6, pady=10)
-            b.state(["disabled"])
-            self.action_buttons[a.key] = b
+        # create disabled, then pack all action buttons with one Tcl call (pack takes many slaves)
+        self.action_buttons: dict[str, ttk.Button] = {
+            a.key: ttk.Button(self.top, text=a.button_text, command=lambda aa=a: self.run_action(aa), state="disabled")
+            for a in self.actions
+        }
+        if self.action_buttons:
+            self.tk.call("pack", *self.action_buttons.values(), "-side", "left", "-padx", 6, "-pady", 10)
 
         self.top_spacer = ttk.Frame(self.top, style="Topbar.TFrame")
         self.top_spacer.pack(side="left", fill="x", expand=True)
@@ -72,11 +96,11 @@ class MainWindow(tk.Tk):
         self._status_labels["raptor"] = ttk.Label(self.status, text="Raptor: ⬤ not loaded", style="Muted.TLabel")
         self._status_labels["raptor"].pack(side="left", padx=(0, 16), pady=(0, 8))
 
-        for a in self.actions:
-            key = f"status_{a.key}"
-            lbl = ttk.Label(self.status, text=f"{a.name}: ⬤ not ready", style="Muted.TLabel")
-            lbl.pack(side="left", padx=(0, 16), pady=(0, 8))
-            self._status_labels[key] = lbl
+        action_labels = [ttk.Label(self.status, text=f"{a.name}: ⬤ not ready", style="Muted.TLabel") for a in self.actions]
+        for a, lbl in zip(self.actions, action_labels):
+            self._status_labels[f"status_{a.key}"] = lbl
+        if action_labels:
+            self.tk.call("pack", *action_labels, "-side", "left", "-padx", (0, 16), "-pady", (0, 8))
 
         # Middle split
         self.middle = ttk.Frame(self, style="App.TFrame")
@@ -145,6 +169,10 @@ class MainWindow(tk.Tk):
         self.logger.log("App started. Tip: Load Underlying → Load Raptor → Run all ▶")
         self._refresh_pipeline_ui()
 
+    def destroy(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     # --- view switching ---
     def _show_view(self, view: tk.Widget):
         if self._current_view is not None:
@@ -156,6 +184,8 @@ class MainWindow(tk.Tk):
     def show_raptor(self): self._show_view(self.raptor_view)
 
     def show_action(self, action: ActionSpec):
+        if self.state.is_action_pending(action.key) and self._raptor_df is not None:
+            self._compute_action(action, self._raptor_df)
         self._show_view(self.action_views[action.key])
 
     # --- pipeline setters ---
@@ -168,12 +198,36 @@ class MainWindow(tk.Tk):
         self._refresh_pipeline_ui()
 
     def set_raptor_df(self, df: pd.DataFrame):
+        to_cat = [c for c in self.RAPTOR_CATEGORY_COLS
+                  if c in df.columns and not isinstance(df[c].dtype, pd.CategoricalDtype)
+                  and (df[c].dtype == object or pd.api.types.is_string_dtype(df[c]))]
+        # remaining object columns that hold strings -> Arrow-backed strings
+        to_text = [c for c in df.columns
+                   if c not in to_cat and df[c].dtype == object
+                   and pd.api.types.infer_dtype(df[c], skipna=True) == "string"]
+        # 64-bit numerics downcast (float32 within pandas' tolerance, smallest fitting int):
+        # every action scan and groupby then moves half the bytes or less
+        to_small = {c: pd.to_numeric(df[c], downcast="float" if df[c].dtype.kind == "f" else "integer")
+                    for c in df.select_dtypes(include=["float64", "int64"]).columns}
+        to_small = {c: s for c, s in to_small.items() if s.dtype != df[c].dtype}
+        if to_cat or to_text or to_small:
+            df = df.assign(**{c: df[c].astype("category") for c in to_cat},
+                           **{c: df[c].astype(TEXT_DTYPE) for c in to_text},
+                           **to_small)
         self._raptor_df = df
+        self._raptor_version += 1
+        self._action_cache.clear()
+        self._raptor_groupers = build_groupers(df)
         self.state.mark_raptor_loaded()
+        # the view keeps the full frame for filtering/search and hands its table only
+        # the first row_limit rows of the current view
         self.raptor_view.set_dataframe(df)
-        self.logger.log(f"Loaded raptor: {len(df):,} rows × {df.shape[1]} cols. (UI shows first 500)")
-        for b in self.action_buttons.values():
-            b.state(["!disabled"])
+        limit = self.raptor_view.row_limit
+        shown = f" (UI shows first {limit:,})" if limit is not None and len(df) > limit else ""
+        self.logger.log(f"Loaded raptor: {len(df):,} rows × {df.shape[1]} cols.{shown}")
+        for key, b in self.action_buttons.items():
+            if key not in self._inflight:
+                b.state(["!disabled"])
         self._refresh_pipeline_ui()
 
     def get_underlyings_df(self) -> pd.DataFrame | None:
@@ -190,7 +244,13 @@ class MainWindow(tk.Tk):
         for a in self.actions:
             status_key = f"status_{a.key}"
             nav_btn = self.nav_action_buttons[a.key]
-            if not self.state.is_action_ready(a.key):
+            if self.state.is_action_pending(a.key):
+                self._status_labels[status_key].configure(text=f"{a.name}: ⏳ pending")
+                nav_btn.configure(text=f"{a.name}  ⏳")
+            elif self.state.is_action_failed(a.key):
+                self._status_labels[status_key].configure(text=f"{a.name}: ✖ failed")
+                nav_btn.configure(text=f"{a.name}  ✖")
+            elif not self.state.is_action_ready(a.key):
                 self._status_labels[status_key].configure(text=f"{a.name}: ⬤ not ready")
                 nav_btn.configure(text=a.name)
             else:
@@ -214,55 +274,163 @@ class MainWindow(tk.Tk):
         if df is None or df.empty:
             return None
         issuer = row.get("issuer") or row.get("Issuer") or row.get("ISSUER")
-        if not issuer or "issuer" not in df.columns:
+        if not issuer:
             return None
 
-        sub = df[df["issuer"].astype("string") == str(issuer)]
-        # Choose x/y
-        x_col = "strike" if "strike" in sub.columns else None
-        y_col = "spread_bps" if "spread_bps" in sub.columns else None
-        if x_col is None or y_col is None:
+        if self._issuer_xy_version != self._raptor_version:
+            self._issuer_xy = self._build_issuer_xy(df)
+            self._issuer_xy_version = self._raptor_version
+        hit = self._issuer_xy.get(str(issuer))
+        if hit is None:
             return None
-
-        x = pd.to_numeric(sub[x_col], errors="coerce").to_numpy()
-        y = pd.to_numeric(sub[y_col], errors="coerce").to_numpy()
+        x, y, mean_x, mean_y = hit
 
         # Highlight mean point (or use values from table if available)
         try:
-            hx = float(row.get("avg_strike")) if row.get("avg_strike") not in (None, "") else float(np.nanmean(x))
+            hx = float(row.get("avg_strike")) if row.get("avg_strike") not in (None, "") else mean_x
         except Exception:
-            hx = float(np.nanmean(x))
+            hx = mean_x
         try:
-            hy = float(row.get("avg_spread_bps")) if row.get("avg_spread_bps") not in (None, "") else float(np.nanmean(y))
+            hy = float(row.get("avg_spread_bps")) if row.get("avg_spread_bps") not in (None, "") else mean_y
         except Exception:
-            hy = float(np.nanmean(y))
+            hy = mean_y
 
         return PlotData(x=x, y=y, highlight=(hx, hy), title=f"{issuer} — strike vs spread (downsampled)")
 
+    @staticmethod
+    def _build_issuer_xy(df: pd.DataFrame) -> dict[str, tuple[np.ndarray, np.ndarray, float, float]]:
+        """
+        Splits strike/spread_bps by issuer in one pass: coerce both columns once, stable-sort
+        the rows by issuer code and slice each issuer's block (rows keep their original order).
+        """
+        issuer_col = next((c for c in ("issuer", "Issuer", "ISSUER") if c in df.columns), None)
+        if issuer_col is None or "strike" not in df.columns or "spread_bps" not in df.columns:
+            return {}
+
+        iss = df[issuer_col]
+        cat = iss.cat if isinstance(iss.dtype, pd.CategoricalDtype) else iss.astype("category").cat
+        codes = cat.codes.to_numpy()
+        x = pd.to_numeric(df["strike"], errors="coerce").to_numpy(dtype=float)
+        y = pd.to_numeric(df["spread_bps"], errors="coerce").to_numpy(dtype=float)
+
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(cat.categories) + 1))
+        out = {}
+        for k, name in enumerate(cat.categories):
+            rows = order[bounds[k]:bounds[k + 1]]
+            if len(rows) == 0:
+                continue
+            xs, ys = x[rows], y[rows]
+            out[str(name)] = (xs, ys, float(np.nanmean(xs)), float(np.nanmean(ys)))
+        return out
+
     # --- run actions ---
     def run_action(self, action: ActionSpec):
         raptor = self._guard_raptor()
         if raptor is None:
             return
 
+        if action.lazy:
+            # queue it; show_action computes pending actions on demand
+            self.state.mark_action_pending(action.key)
+        else:
+            self._compute_action(action, raptor)
+        self.show_action(action)
+        self._refresh_pipeline_ui()
+
+    def _compute_action(self, action: ActionSpec, raptor: pd.DataFrame):
+        src = (id(raptor), self._raptor_version)
+        if (action.key, *src) in self._action_cache:
+            # the view already holds results for this exact raptor frame
+            self.state.mark_action_computed(action.key)
+            self._refresh_pipeline_ui()
+            return
+        if action.key in self._inflight:
+            # already computing for this frame: its result lands in the view when done
+            return
+
         self.logger.log(f"Running {action.button_text}…")
-        try:
-            if action.view_type == "spread_matrix":
+        if action.view_type == "spread_matrix":
+            # the matrix view computes and fills its table in set_raptor: stays on the Tk thread
+            try:
                 v: SpreadMatrixView = self.action_views[action.key]  # type: ignore
                 v.set_raptor(raptor)
                 self.state.mark_action_computed(action.key)
+                self._action_cache[(action.key, *src)] = None  # result lives in the view
                 self.logger.log(f"{action.name} ready.")
-                self.show_action(action)
-            elif action.view_type == "table_plot":
+                self._refresh_pipeline_ui()
+            except Exception as e:
+                self.state.mark_action_failed(action.key)
+                self._refresh_pipeline_ui()
+                self.logger.log(f"ERROR in {action.button_text}: {e}")
+                messagebox.showerror(f"{action.button_text} error", str(e))
+            return
+
+        self._inflight[action.key] = (self._executor.submit(action.call, raptor, self._raptor_groupers), src)
+        self.action_buttons[action.key].state(["disabled"])
+        self._schedule_poll()
+
+    def run_in_background(self, label: str, fn: Callable[..., Any], *args, on_done: Callable[[Any], None],
+                          button: ttk.Button | None = None):
+        """
+        Runs fn(*args) on the worker pool and calls on_done(result) on the Tk thread once it
+        finishes (errors are logged and shown instead). button stays disabled meanwhile.
+        """
+        if label in self._bg_jobs:
+            self.logger.log(f"{label} is already running.")
+            return
+        if button is not None:
+            button.state(["disabled"])
+        self.logger.log(f"{label}…")
+        self._bg_jobs[label] = (self._executor.submit(fn, *args), on_done, button)
+        self._schedule_poll()
+
+    def _schedule_poll(self):
+        if self._poll_job is None:
+            self._poll_job = self.after(self.POLL_MS, self._poll_actions)
+
+    def _poll_actions(self):
+        self._poll_job = None
+        for key, (fut, src) in list(self._inflight.items()):
+            if fut.done():
+                del self._inflight[key]
+                self._on_action_done(self._actions_by_key[key], fut, src)
+        for label, (fut, on_done, button) in list(self._bg_jobs.items()):
+            if fut.done():
+                del self._bg_jobs[label]
+                self._on_background_done(label, fut, on_done, button)
+        if self._inflight or self._bg_jobs:
+            self._schedule_poll()
+
+    def _on_background_done(self, label: str, fut: Future, on_done: Callable[[Any], None], button: ttk.Button | None):
+        if button is not None:
+            button.state(["!disabled"])
+        try:
+            result = fut.result()
+        except Exception as e:
+            self.logger.log(f"ERROR in {label}: {e}")
+            messagebox.showerror(f"{label} error", str(e))
+            return
+        on_done(result)
+
+    def _on_action_done(self, action: ActionSpec, fut: Future, src: tuple[int, int]):
+        self.action_buttons[action.key].state(["!disabled"])
+        if src != (id(self._raptor_df), self._raptor_version):
+            # raptor was reloaded while this ran: drop the result, redo pending work on the new frame
+            self.logger.log(f"{action.name}: discarded result for a replaced Raptor.")
+            if self.state.is_action_pending(action.key) and self._raptor_df is not None:
+                self._compute_action(action, self._raptor_df)
+            return
+
+        try:
+            out = fut.result()
+            if action.view_type == "table_plot":
                 v: TablePlotView = self.action_views[action.key]  # type: ignore
-                out = action.run(raptor)
                 if isinstance(out, pd.DataFrame):
                     v.set_dataframe(out)
                 self.state.mark_action_computed(action.key)
                 self.logger.log(f"{action.name} ready: {len(out):,} rows × {out.shape[1]} cols.")
-                self.show_action(action)
             else:
-                out = action.run(raptor)
                 if not isinstance(out, pd.DataFrame):
                     raise ValueError("Action returned non-DataFrame for a table view.")
                 self._action_dfs[action.key] = out
@@ -270,10 +438,12 @@ class MainWindow(tk.Tk):
                 v: DataView = self.action_views[action.key]  # type: ignore
                 v.set_dataframe(out)
                 self.logger.log(f"{action.name} ready: {len(out):,} rows × {out.shape[1]} cols.")
-                self.show_action(action)
 
+            self._action_cache[(action.key, *src)] = out
             self._refresh_pipeline_ui()
         except Exception as e:
+            self.state.mark_action_failed(action.key)
+            self._refresh_pipeline_ui()
             self.logger.log(f"ERROR in {action.button_text}: {e}")
             messagebox.showerror(f"{action.button_text} error", str(e))
 
@@ -289,6 +459,10 @@ class MainWindow(tk.Tk):
             return
 
         for a in self.actions:
-            self.run_action(a)
+            if a.lazy:
+                self.state.mark_action_pending(a.key)
+            else:
+                self._compute_action(a, self._raptor_df)
+        self._refresh_pipeline_ui()
 
-        self.logger.log("Run all ▶ done. ✨")
+        self.logger.log("Run all ▶ done. ✨ Pending actions compute when opened.")
@@ -21,59 +21,65 @@ class PlotCanvas(tk.Canvas):
         super().__init__(parent, highlightthickness=1, highlightbackground="#d2d9ea", bg="#ffffff", **kwargs)
         self._data: Optional[PlotData] = None
         self._max_points = 2000
+        # downsampled finite float points + their bounds, prepared once per set_data;
+        # resizes only rescale them
+        self._points: Optional[tuple[np.ndarray, np.ndarray, tuple[float, float, float, float]]] = None
         self.bind("<Configure>", lambda e: self.redraw())
 
     def set_data(self, data: PlotData):
         self._data = data
+        self._points = self._prepare(data)
         self.redraw()
 
     def clear(self):
         self._data = None
+        self._points = None
         self.delete("all")
 
-    def redraw(self):
-        self.delete("all")
-        if self._data is None:
-            self.create_text(10, 10, anchor="nw", text="(select a row to plot)", fill="#5c6f8f")
-            return
-
-        x = np.asarray(self._data.x)
-        y = np.asarray(self._data.y)
+    def _prepare(self, data: PlotData):
+        x = np.asarray(data.x)
+        y = np.asarray(data.y)
         if x.size == 0 or y.size == 0:
-            self.create_text(10, 10, anchor="nw", text="(no data)", fill="#5c6f8f")
-            return
+            return None
 
-        w = max(10, int(self.winfo_width()))
-        h = max(10, int(self.winfo_height()))
-        pad = 40
-
-        # Downsample (stride)
+        # Downsample (stride) first: coerce and mask only the points that get drawn
         n = int(min(len(x), len(y)))
-        if n > self._max_points:
-            step = max(1, n // self._max_points)
-            x = x[:n:step]
-            y = y[:n:step]
-        else:
-            x = x[:n]
-            y = y[:n]
-
-        x = x.astype(float, copy=False)
-        y = y.astype(float, copy=False)
+        step = max(1, n // self._max_points) if n > self._max_points else 1
+        x = np.ascontiguousarray(x[:n:step], dtype=np.float64)
+        y = np.ascontiguousarray(y[:n:step], dtype=np.float64)
 
         mask = np.isfinite(x) & np.isfinite(y)
         x = x[mask]
         y = y[mask]
-
         if x.size == 0:
-            self.create_text(10, 10, anchor="nw", text="(no finite data)", fill="#5c6f8f")
-            return
+            return x, y, None
 
-        xmin, xmax = float(np.min(x)), float(np.max(x))
-        ymin, ymax = float(np.min(y)), float(np.max(y))
+        xmin, xmax = float(x.min()), float(x.max())
+        ymin, ymax = float(y.min()), float(y.max())
         if xmin == xmax:
             xmax = xmin + 1.0
         if ymin == ymax:
             ymax = ymin + 1.0
+        return x, y, (xmin, xmax, ymin, ymax)
+
+    def redraw(self):
+        self.delete("all")
+        if self._data is None:
+            self.create_text(10, 10, anchor="nw", text="(select a row to plot)", fill="#5c6f8f")
+            return
+
+        if self._points is None:
+            self.create_text(10, 10, anchor="nw", text="(no data)", fill="#5c6f8f")
+            return
+        x, y, bounds = self._points
+        if bounds is None:
+            self.create_text(10, 10, anchor="nw", text="(no finite data)", fill="#5c6f8f")
+            return
+        xmin, xmax, ymin, ymax = bounds
+
+        w = max(10, int(self.winfo_width()))
+        h = max(10, int(self.winfo_height()))
+        pad = 40
 
         # Axes
         self.create_line(pad, h - pad, w - pad, h - pad, fill="#c7d2fe")
@@ -82,19 +88,27 @@ class PlotCanvas(tk.Canvas):
         if self._data.title:
             self.create_text(pad, 10, anchor="nw", text=self._data.title, fill="#12223a")
 
-        def sx(v): return pad + (v - xmin) / (xmax - xmin) * (w - 2 * pad)
-        def sy(v): return (h - pad) - (v - ymin) / (ymax - ymin) * (h - 2 * pad)
+        # data -> canvas: one scale factor per axis, shared by the points and the highlight
+        kx = (w - 2 * pad) / (xmax - xmin)
+        ky = (h - 2 * pad) / (ymax - ymin)
 
+        # points: coordinates scaled as arrays, all ovals created by one Tcl script
+        # instead of one create_oval() round trip per point
         r = 2
-        for xv, yv in zip(x, y):
-            cx, cy = sx(float(xv)), sy(float(yv))
-            self.create_oval(cx - r, cy - r, cx + r, cy + r, outline="", fill="#2563eb")
+        cx = pad + (x - xmin) * kx
+        cy = (h - pad) - (y - ymin) * ky
+        canvas = str(self)
+        self.tk.eval("\n".join(
+            f"{canvas} create oval {x0:.1f} {y0:.1f} {x1:.1f} {y1:.1f} -outline {{}} -fill #2563eb"
+            for x0, y0, x1, y1 in zip((cx - r).tolist(), (cy - r).tolist(), (cx + r).tolist(), (cy + r).tolist())
+        ))
 
         if self._data.highlight is not None:
             hx, hy = self._data.highlight
             try:
-                cx, cy = sx(float(hx)), sy(float(hy))
+                hcx = pad + (float(hx) - xmin) * kx
+                hcy = (h - pad) - (float(hy) - ymin) * ky
                 R = 7
-                self.create_oval(cx - R, cy - R, cx + R, cy + R, outline="#ef4444", width=2, fill="")
+                self.create_oval(hcx - R, hcy - R, hcx + R, hcy + R, outline="#ef4444", width=2, fill="")
             except Exception:
                 pass
@@ -4,13 +4,59 @@ from __future__ import annotations
 import tkinter as tk
 from tkinter import ttk
 
+import numpy as np
 import pandas as pd
 
 from .data_table import DataTable
 
 
+def _equals(s: pd.Series, value: str) -> np.ndarray:
+    """Boolean mask of s == value; for categoricals a single int compare on the codes."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        code = s.cat.categories.get_indexer([value])[0]
+        if code < 0:
+            return np.zeros(len(s), dtype=bool)
+        return s.cat.codes.to_numpy() == code
+    return (s == value).to_numpy()
+
+
+def _cell_codes(key: pd.Series, issuer: pd.Series) -> np.ndarray:
+    """Flat (key, issuer) cell per row from category codes: key_code * n_issuers + issuer_code, -1 if either is NaN."""
+    k = key.cat.codes.to_numpy().astype(np.int32)
+    i = issuer.cat.codes.to_numpy().astype(np.int32)
+    return np.where((k >= 0) & (i >= 0), k * np.int32(len(issuer.cat.categories)) + i, -1).astype(np.int32)
+
+
+def _mean_matrix(cell: np.ndarray, values: np.ndarray, keys: pd.Index, issuers: pd.Index) -> pd.DataFrame:
+    """
+    keys x issuers mean of values over the rows' _cell_codes: bincount over the flat cell,
+    same result as groupby(observed=True).mean() + pivot.
+    """
+    n_k, n_i = len(keys), len(issuers)
+
+    seen = cell >= 0  # NaN keys are dropped, as groupby does
+    cell = cell[seen]
+    v = values[seen]
+    ok = ~np.isnan(v)  # mean skips NaN values
+    size = n_k * n_i
+    present = np.bincount(cell, minlength=size).reshape(n_k, n_i) > 0
+    counts = np.bincount(cell[ok], minlength=size).reshape(n_k, n_i)
+    sums = np.bincount(cell[ok], weights=v[ok], minlength=size).reshape(n_k, n_i)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = sums / counts  # 0 / 0 -> NaN for cells without values
+
+    # only observed keys/issuers become rows/columns, as with observed=True + pivot
+    rows, cols = present.any(axis=1), present.any(axis=0)
+    return pd.DataFrame(
+        mean[np.ix_(rows, cols)],
+        index=keys[rows],
+        columns=issuers[cols],
+    )
+
+
 class SpreadMatrixView(ttk.Frame):
     SHOW_LIMIT = 300
+    DENSE_MAX_CELLS = 5_000_000  # largest key x issuer grid built densely by _mean_matrix
 
     def __init__(self, parent: tk.Misc, title: str, on_log):
         super().__init__(parent, style="Panel.TFrame")
@@ -18,6 +64,10 @@ class SpreadMatrixView(ttk.Frame):
         self.title = title
 
         self._raptor: pd.DataFrame | None = None
+        self._work: pd.DataFrame | None = None  # see _build_work_frame
+        self._cell_labels: tuple[pd.Index, pd.Index] | None = None  # (keys, issuers) of the work frame's _cell
+        # (product, callput) -> (sorted matrix, filtered row count), per raptor
+        self._matrix_cache: dict[tuple[str, str], tuple[pd.DataFrame, int]] = {}
 
         header = ttk.Frame(self, style="Panel.TFrame")
         header.grid(row=0, column=0, sticky="ew", padx=12, pady=(12, 6))
@@ -67,9 +117,11 @@ class SpreadMatrixView(ttk.Frame):
 
     def set_raptor(self, raptor: pd.DataFrame):
         self._raptor = raptor
+        self._work = self._build_work_frame(raptor)
+        self._matrix_cache.clear()
         if "product" in raptor.columns:
             try:
-                vals = raptor["product"].astype("string").dropna().unique().tolist()
+                vals = self._work["product"].dropna().unique().astype(str).tolist()
                 vals = sorted([v for v in vals if v not in ("", "nan", "NaN", "<NA>")])
                 self.product_cb.configure(values=["All"] + vals)
             except Exception:
@@ -83,65 +135,108 @@ class SpreadMatrixView(ttk.Frame):
                 return b, a
         return None
 
+    def _find_key_col(self, df: pd.DataFrame) -> str:
+        for k in ["underlying_isin", "underlying_wkn", "isin", "wkn"]:
+            if k in df.columns:
+                return k
+        return df.columns[0]
+
+    def _build_work_frame(self, raptor: pd.DataFrame) -> pd.DataFrame:
+        """
+        Only the columns recompute reads: filters, matrix key, issuer and |Ask - Bid|.
+        The spread is coerced to numbers once per raptor (float32), not on every Apply;
+        string filter/key columns become categoricals (code compares, code groupby), and
+        with a categorical key and issuer each row's flat matrix cell is precomputed too.
+        """
+        cols = {c: raptor[c] for c in ("product", "callput", "type", "issuer") if c in raptor.columns}
+        key_col = self._find_key_col(raptor)
+        cols[key_col] = raptor[key_col]
+        for c, s in cols.items():
+            if not isinstance(s.dtype, pd.CategoricalDtype) and (s.dtype == object or pd.api.types.is_string_dtype(s)):
+                cols[c] = s.astype("category")
+        ba = self._find_bid_ask_cols(raptor)
+        if ba is not None:
+            bid_col, ask_col = ba
+            spread = (pd.to_numeric(raptor[ask_col], errors="coerce") - pd.to_numeric(raptor[bid_col], errors="coerce")).abs()
+            cols["_abs_spread"] = spread.astype("float32")
+
+        self._cell_labels = None
+        k, i = cols[key_col], cols.get("issuer")
+        if (i is not None and isinstance(k.dtype, pd.CategoricalDtype) and isinstance(i.dtype, pd.CategoricalDtype)
+                and len(k.cat.categories) * len(i.cat.categories) <= self.DENSE_MAX_CELLS):
+            cols["_cell"] = _cell_codes(k, i)
+            self._cell_labels = (k.cat.categories.rename(key_col), i.cat.categories.rename("issuer"))
+        return pd.DataFrame(cols)
+
     def recompute(self):
         if self._raptor is None or self._raptor.empty:
             self.table.clear()
             self.count_lbl.configure(text="(load Raptor first)")
             return
 
-        df = self._raptor
+        df = self._work
         total_rows = len(df)
         prod = self.product_var.get()
         cp = self.cp_var.get()
 
+        hit = self._matrix_cache.get((prod, cp))
+        if hit is None:
+            hit = self._compute_matrix(df, prod, cp)
+            if hit is None:
+                return
+            self._matrix_cache[(prod, cp)] = hit
+        mat, filtered_rows = hit
+
+        shown_rows = min(self.SHOW_LIMIT, len(mat))
+        mat_show = mat.head(self.SHOW_LIMIT).round(6).reset_index()
+
+        self.table.set_dataframe(mat_show)
+        self.count_lbl.configure(text=f"total {total_rows:,} | filtered {filtered_rows:,} | showing {shown_rows:,} underlyings")
+        self._stat_labels[0].configure(text=f"Underlyings shown: {shown_rows:,}")
+        self._stat_labels[1].configure(text=f"Issuers: {mat.shape[1]:,}")
+        self._stat_labels[2].configure(text=f"Filters: product={prod}, callput={cp}")
+        self._stat_labels[3].configure(text="Sort ▲▼ · dblclick copy · Ctrl+C")
+
+    def _compute_matrix(self, df: pd.DataFrame, prod: str, cp: str) -> tuple[pd.DataFrame, int] | None:
+        """Key x issuer mean spread for one filter selection; None (with a message shown) if it can't be built."""
+        total_rows = len(df)
+        # both predicates fused into one mask; only the arrays the matrix reads get filtered
+        mask = None
         if prod != "All" and "product" in df.columns:
-            df = df[df["product"].astype("string") == prod]
-        if cp != "All":
-            if "callput" in df.columns:
-                df = df[df["callput"].astype("string") == cp]
-            elif "type" in df.columns:
-                df = df[df["type"].astype("string") == cp]
+            mask = _equals(df["product"], prod)
+        cp_col = "callput" if "callput" in df.columns else ("type" if "type" in df.columns else None)
+        if cp != "All" and cp_col is not None:
+            m = _equals(df[cp_col], cp)
+            mask = m if mask is None else mask & m
 
-        filtered_rows = len(df)
+        filtered_rows = len(df) if mask is None else int(mask.sum())
 
-        key_col = None
-        for k in ["underlying_isin", "underlying_wkn", "isin", "wkn"]:
-            if k in df.columns:
-                key_col = k
-                break
-        if key_col is None:
-            key_col = df.columns[0]
+        key_col = self._find_key_col(self._raptor)
 
         if "issuer" not in df.columns:
             out = pd.DataFrame({"info": ["Missing issuer column for matrix."]})
             self.table.set_dataframe(out)
             self.count_lbl.configure(text=f"total {total_rows:,} | filtered {filtered_rows:,}")
-            return
+            return None
 
-        ba = self._find_bid_ask_cols(df)
-        if ba is None:
+        if "_abs_spread" not in df.columns:
             out = pd.DataFrame({"info": ["Missing Bid/Ask columns for matrix."]})
             self.table.set_dataframe(out)
             self.count_lbl.configure(text=f"total {total_rows:,} | filtered {filtered_rows:,}")
-            return
-
-        bid_col, ask_col = ba
-        spread = (pd.to_numeric(df[ask_col], errors="coerce") - pd.to_numeric(df[bid_col], errors="coerce")).abs()
-        tmp = df[[key_col, "issuer"]].copy()
-        tmp["abs_spread"] = spread
-
-        g = tmp.groupby([key_col, "issuer"], observed=True)["abs_spread"].mean().reset_index()
-        mat = g.pivot(index=key_col, columns="issuer", values="abs_spread")
-
-        mat["_avg"] = mat.mean(axis=1, skipna=True)
-        mat = mat.sort_values("_avg", ascending=False).drop(columns=["_avg"])
-
-        shown_rows = min(self.SHOW_LIMIT, len(mat))
-        mat_show = mat.head(self.SHOW_LIMIT).round(6).reset_index()
-
-        self.table.set_dataframe(mat_show)
-        self.count_lbl.configure(text=f"total {total_rows:,} | filtered {filtered_rows:,} | showing {shown_rows:,} underlyings")
-        self._stat_labels[0].configure(text=f"Underlyings shown: {shown_rows:,}")
-        self._stat_labels[1].configure(text=f"Issuers: {mat.shape[1]:,}")
-        self._stat_labels[2].configure(text=f"Filters: product={prod}, callput={cp}")
-        self._stat_labels[3].configure(text="Sort ▲▼ · dblclick copy · Ctrl+C")
+            return None
+
+        if self._cell_labels is not None:
+            cell, vals = df["_cell"].to_numpy(), df["_abs_spread"].to_numpy()
+            if mask is not None:
+                cell, vals = cell[mask], vals[mask]
+            mat = _mean_matrix(cell, vals, *self._cell_labels)
+        else:
+            if mask is not None:
+                df = df[mask]
+            g = df.groupby([key_col, "issuer"], observed=True)["_abs_spread"].mean().reset_index()
+            mat = g.pivot(index=key_col, columns="issuer", values="_abs_spread")
+
+        # row order by mean spread across issuers; kept out of mat (its columns may be a CategoricalIndex)
+        avg = mat.mean(axis=1, skipna=True)
+        mat = mat.loc[avg.sort_values(ascending=False).index]
+        return mat, filtered_rows